@@ -7,35 +7,62 @@ from jupyter_server.utils import url_path_join
 
 from .handlers import (
     LockNotebookHandler,
+    BulkLockNotebookHandler,
     UnlockNotebookHandler,
     CommitNotebookHandler,
     UserInfoHandler,
     NotebookStatusHandler,
+    BatchNotebookStatusHandler,
     GitRepositoryStatusHandler
 )
 
 
 class GitLockSignExtension(ExtensionApp):
     """Jupyter server extension for git-based notebook locking and signing."""
-    
+
     name = "git_lock_sign_jlx"
-    
+
+    def initialize_settings(self):
+        """Create the shared service singletons used by all handlers."""
+        from .services import (
+            GitService,
+            GPGService,
+            NotebookService,
+            UserService,
+        )
+
+        self.settings.update(
+            {
+                "glx_git_service": GitService(),
+                "glx_gpg_service": GPGService(),
+                "glx_notebook_service": NotebookService(),
+                "glx_user_service": UserService(),
+            }
+        )
+
     def initialize_handlers(self):
         """Initialize the request handlers."""
-        handlers = [
-            (r"/git-lock-sign/lock-notebook", LockNotebookHandler),
-            (r"/git-lock-sign/unlock-notebook", UnlockNotebookHandler),
-            (r"/git-lock-sign/commit-notebook", CommitNotebookHandler),
-            (r"/git-lock-sign/user-info", UserInfoHandler),
-            (r"/git-lock-sign/notebook-status", NotebookStatusHandler),
-            (r"/git-lock-sign/repository-status", GitRepositoryStatusHandler),
-        ]
-        
-        # Add the handlers to the web app with proper base URL
-        self.handlers.extend([
-            (url_path_join(self.settings.get('base_url', '/'), handler[0]), handler[1])
-            for handler in handlers
-        ])
+        # base_url is constant for the life of the server; resolve it once
+        # and register the full routing table in a single extend.
+        base_url = self.settings.get("base_url", "/")
+        self.handlers.extend(
+            [
+                (url_path_join(base_url, pattern), handler)
+                for pattern, handler in [
+                    (r"/git-lock-sign/lock-notebook", LockNotebookHandler),
+                    (r"/git-lock-sign/bulk-lock-notebook", BulkLockNotebookHandler),
+                    (r"/git-lock-sign/unlock-notebook", UnlockNotebookHandler),
+                    (r"/git-lock-sign/commit-notebook", CommitNotebookHandler),
+                    (r"/git-lock-sign/user-info", UserInfoHandler),
+                    (r"/git-lock-sign/notebook-status", NotebookStatusHandler),
+                    (
+                        r"/git-lock-sign/batch-notebook-status",
+                        BatchNotebookStatusHandler,
+                    ),
+                    (r"/git-lock-sign/repository-status", GitRepositoryStatusHandler),
+                ]
+            ]
+        )
 
 
 def _jupyter_server_extension_points():
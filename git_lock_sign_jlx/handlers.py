@@ -1,11 +1,20 @@
 """Handlers for git lock and sign JupyterLab extension."""
 
+import asyncio
 import json
 import logging
 import os
+import traceback
 from typing import Any, Dict
 
 from jupyter_server.base.handlers import APIHandler
+from tornado.web import HTTPError
+
+try:
+    import orjson
+except ImportError:
+    # orjson is an optional accelerator; fall back to the stdlib.
+    orjson = None
 
 from .logger_util import default_logger_config
 from .services.git_service import GitService
@@ -16,381 +25,512 @@ from .services.user_service import UserService
 logger = logging.getLogger(__name__)
 default_logger_config(logger)
 
+# Largest accepted request body. Generous enough for output-heavy
+# notebooks, small enough to stop a misbehaving client from holding
+# gigabytes in memory per request.
+MAX_BODY_BYTES = 64 * 1024 * 1024
+
+# Cap on cached status responses. Entries are keyed per notebook path
+# and never expire on their own, so clear the cache wholesale once it
+# fills - rebuilding a status answer is cheap and this keeps a client
+# that polls many distinct paths from growing the dict forever.
+STATUS_CACHE_MAX_ENTRIES = 1024
+
+
+def json_loads(body: bytes) -> Any:
+    """Parse JSON request bytes with orjson when available."""
+    if orjson is not None:
+        return orjson.loads(body)
+    return json.loads(body.decode("utf-8"))
+
+
+def json_dumps(data: Dict[str, Any]) -> bytes:
+    """Serialize a response dict to JSON bytes with orjson when available."""
+    if orjson is not None:
+        return orjson.dumps(data)
+    # Compact separators match orjson's output and shave whitespace off
+    # large responses.
+    return json.dumps(data, separators=(",", ":")).encode("utf-8")
+
+
+def _norm_key(key_id: str) -> str:
+    """Normalize a GPG key id / fingerprint for comparison.
+
+    Strips whitespace (fingerprints are often displayed in spaced
+    groups), a leading ``0x`` prefix, and case, so the comparison below
+    operates on canonical lowercase hex regardless of which format git
+    or the stored metadata used.
+    """
+    return key_id.strip().lower().removeprefix("0x").replace(" ", "")
+
+
+# Pre-encoded bodies for the fixed error messages on hot rejection
+# paths; skips the per-request dict allocation and JSON encode.
+_ERR_INVALID_JSON = json_dumps({"error": "Invalid JSON in request body"})
+_ERR_MISSING_PARAMS = json_dumps(
+    {"error": "Missing notebook_path or notebook_content"}
+)
+_ERR_MISSING_PATH = json_dumps({"error": "Missing notebook_path"})
+_ERR_NOT_GIT_REPO = json_dumps({"error": "Notebook is not in a git repository"})
+_ERR_NO_SIGNATURE = json_dumps({"error": "No signature found in notebook"})
+
+# Conditional-disclosure error templates for the unlock GPG validation
+# ladder, keyed by (reason, user_matches). Truncated key IDs are only
+# disclosed when the requester already matches the original signer.
+_UNLOCK_ERROR_TEMPLATES = {
+    ("no_signing_key", True): (
+        "Cannot unlock GPG-signed notebook: No git signing key "
+        "configured. Please configure a GPG key ending in {short_key_id} "
+        "with: git config user.signingkey [YOUR_KEY_ID]"
+    ),
+    ("no_signing_key", False): (
+        "Cannot unlock GPG-signed notebook: You do not have access to "
+        "the required GPG key. Please ensure you are the original signer "
+        "with proper GPG configuration."
+    ),
+    ("key_mismatch", True): (
+        "Cannot unlock GPG-signed notebook: Git signing key mismatch. "
+        "Original commit was signed with key ending in "
+        "{short_original_key}, but current git configuration uses key "
+        "ending in {short_current_key}. Please configure the correct key "
+        "with: git config user.signingkey [YOUR_KEY_ID]"
+    ),
+    ("key_mismatch", False): (
+        "Cannot unlock GPG-signed notebook: Git signing key "
+        "configuration does not match. Please ensure you are the "
+        "original signer with the correct GPG key configured."
+    ),
+    ("cannot_sign", True): (
+        "Cannot unlock GPG-signed notebook: You do not have the private "
+        "key ending in {short_key_id} required to unlock this notebook. "
+        "Please ensure you have access to the correct GPG private key."
+    ),
+    ("cannot_sign", False): (
+        "Cannot unlock GPG-signed notebook: You do not have access to "
+        "the required private key. Only the user with access to the "
+        "original signing key can unlock this notebook."
+    ),
+}
 
-class BaseGitLockSignHandler(APIHandler):
-    """Base handler for git lock sign operations."""
 
-    def __init__(self, *args, **kwargs):
-        """Initialize the base handler."""
-        super().__init__(*args, **kwargs)
-        self.git_service = GitService()
-        self.gpg_service = GPGService()
-        self.notebook_service = NotebookService()
-        self.user_service = UserService()
+class BaseGitLockSignHandler(APIHandler):
+    """Base handler for git lock sign operations.
+
+    Services are shared singletons stored in the Tornado application
+    settings (created by the extension at startup), so per-service caches
+    survive across requests instead of being rebuilt for every handler
+    instance.
+    """
+
+    @property
+    def git_service(self) -> GitService:
+        """Shared git service singleton."""
+        return self.settings.setdefault("glx_git_service", GitService())
+
+    @property
+    def gpg_service(self) -> GPGService:
+        """Shared GPG service singleton."""
+        return self.settings.setdefault("glx_gpg_service", GPGService())
+
+    @property
+    def notebook_service(self) -> NotebookService:
+        """Shared notebook service singleton."""
+        return self.settings.setdefault("glx_notebook_service", NotebookService())
+
+    @property
+    def user_service(self) -> UserService:
+        """Shared user service singleton."""
+        return self.settings.setdefault("glx_user_service", UserService())
+
+    @property
+    def status_cache(self) -> Dict[str, Any]:
+        """Shared cache of status responses keyed by notebook path."""
+        return self.settings.setdefault("glx_status_cache", {})
+
+    def load_json_body(self) -> Any:
+        """Parse the JSON request body, rejecting oversized payloads early.
+
+        Raises:
+            HTTPError: 413 when the body exceeds ``MAX_BODY_BYTES``
+        """
+        try:
+            content_length = int(self.request.headers.get("Content-Length", 0))
+        except (TypeError, ValueError):
+            content_length = 0
+        if max(content_length, len(self.request.body)) > MAX_BODY_BYTES:
+            raise HTTPError(413, "Request body too large")
+        return json_loads(self.request.body)
 
     def write_json(self, data: Dict[str, Any]):
         """Write JSON response."""
         self.set_header("Content-Type", "application/json")
-        self.write(json.dumps(data))
+        self.write(json_dumps(data))
 
     def write_error_json(self, status_code: int, message: str):
         """Write JSON error response."""
         self.set_status(status_code)
         self.write_json({"error": message})
 
+    def write_error_bytes(self, status_code: int, payload: bytes):
+        """Write a pre-encoded JSON error response."""
+        self.set_status(status_code)
+        self.set_header("Content-Type", "application/json")
+        self.write(payload)
+
     def data_received(self, chunk):
         """Handle data received."""
 
-
-class LockNotebookHandler(BaseGitLockSignHandler):
-    """Handler for locking and signing notebooks with git commits."""
-
-    async def post(self):
-        """Lock and sign a notebook using git commit signing."""
-        try:
-            # Get request data
-            data = json.loads(self.request.body.decode("utf-8"))
-            notebook_path = data.get("notebook_path")
-            notebook_content = data.get("notebook_content")
-            commit_message = data.get("commit_message")
-
-            if not notebook_path or not notebook_content:
-                self.write_error_json(400, "Missing notebook_path or notebook_content")
-                return
-
-            if not commit_message:
-                self.write_error_json(400, "Missing commit_message for lock operation")
-                return
-
-            # Convert relative path to absolute path
-            abs_notebook_path = os.path.abspath(notebook_path)
-
-            # Check if file is in a git repository
-            if not self.git_service.is_git_repository(abs_notebook_path):
-                self.write_error_json(
-                    400,
-                    (
-                        "Notebook is not in a git repository. Please initialize "
-                        "git repository first."
-                    ),
-                )
-                return
-
-            # Get user info
-            user_info = self.user_service.get_user_info()
-            if not user_info:
-                self.write_error_json(
-                    400,
-                    (
-                        "Git user configuration not found. Please configure git "
-                        "user.name and user.email"
-                    ),
-                )
-                return
-
-            # MANDATORY GPG VALIDATION: Pre-lock GPG requirements check
-            logger.info("LockNotebookHandler: ===== MANDATORY GPG VALIDATION =====")
-            logger.info(
-                "LockNotebookHandler: Validating GPG requirements before locking..."
-            )
-
-            # Step 1: Check if GPG is available
-            if not self.gpg_service.is_gpg_available():
-                logger.error(
-                    "LockNotebookHandler: ❌ GPG not available - locking "
-                    "requires GPG signatures"
-                )
-                self.write_error_json(
-                    400,
-                    (
-                        "Cannot lock notebook: GPG is required for locking but "
-                        "not available. Please ensure GPG is installed and "
-                        "configured."
-                    ),
-                )
-                return
-
-            # Step 2: Check if user has signing keys
-            if not self.gpg_service.has_signing_key():
-                logger.error(
-                    "LockNotebookHandler: ❌ No GPG signing keys available - "
-                    "locking requires GPG signatures"
-                )
-                self.write_error_json(
-                    400,
-                    (
-                        "Cannot lock notebook: No GPG signing keys available. "
-                        "Please ensure you have a GPG key configured for "
-                        "signing."
-                    ),
-                )
-                return
-
-            # Step 3: Check if git signing key is configured
-            configured_key = self.gpg_service.get_configured_signing_key()
-            if not configured_key:
-                logger.error(
-                    "LockNotebookHandler: ❌ No git signing key configured - "
-                    "locking requires GPG signatures"
-                )
-                self.write_error_json(
-                    400,
-                    "Cannot lock notebook: No git signing key configured. "
-                    "Please configure a GPG key with: git config "
-                    "user.signingkey [YOUR_KEY_ID]",
-                )
-                return
-
-            logger.info(
-                "LockNotebookHandler: Found configured signing key: %s",
-                configured_key,
-            )
-
-            # Step 4: Test actual signing capability with the configured key
-            if not self.gpg_service.can_sign_with_key(configured_key):
-                logger.error(
-                    "LockNotebookHandler: ❌ Cannot sign with configured GPG "
-                    "key - locking requires GPG signatures"
-                )
-                self.write_error_json(
-                    400,
-                    (
-                        "Cannot lock notebook: Cannot sign with configured GPG "
-                        "key. Please ensure you have access to the private key "
-                        "for signing."
-                    ),
-                )
-                return
-
-            logger.info(
-                "LockNotebookHandler: ✅ GPG validation passed - proceeding "
-                "with mandatory signed lock"
-            )
-
-            # Step 1: Calculate content hash from the original notebook content.
-            # This hash represents the state of the notebook's core content.
-            logger.info(
-                "LockNotebookHandler: Step 1: Calculating content hash from "
-                "original content..."
-            )
-            content_hash = self.notebook_service.generate_content_hash(notebook_content)
-            logger.info("LockNotebookHandler: Original content hash: %s", content_hash)
-
-            # Step 2: Save the notebook content as-is to ensure the file is in a clean
-            # state for the first commit.
-            logger.info(
-                "LockNotebookHandler: Step 2: Saving notebook to disk before "
-                "initial commit..."
+    @staticmethod
+    def _resolve_path(notebook_path: str) -> str:
+        """Resolve a request path to a normalized absolute path.
+
+        JupyterLab usually sends an absolute path already; normpath alone
+        avoids the getcwd syscall os.path.abspath would make on every
+        request.
+        """
+        if os.path.isabs(notebook_path):
+            return os.path.normpath(notebook_path)
+        return os.path.abspath(notebook_path)
+
+    async def _gpg_precondition_error(self) -> Any:
+        """Enforce the mandatory GPG preconditions for locking.
+
+        Returns the user-facing error message when any requirement is not
+        met, or None when locking may proceed. The underlying checks are
+        aggregated and cached in GPGService, so repeated locks in a
+        session skip the gpg subprocess spawns entirely; an uncached run
+        spawns gpg in a worker thread so the event loop keeps serving.
+        """
+        logger.debug("LockNotebookHandler: ===== MANDATORY GPG VALIDATION =====")
+        (
+            gpg_ok,
+            configured_key,
+            gpg_error,
+        ) = await asyncio.to_thread(self.gpg_service.validate_signing_preconditions)
+
+        if not gpg_ok:
+            logger.error(
+                "LockNotebookHandler: ❌ GPG validation failed - locking "
+                "requires GPG signatures: %s",
+                gpg_error,
             )
-            save_success = self.notebook_service.save_notebook_content(
-                abs_notebook_path, notebook_content
+            return gpg_error
+
+        logger.info(
+            "LockNotebookHandler: ✅ GPG validation passed (key: %s) - "
+            "proceeding with mandatory signed lock",
+            configured_key,
+        )
+        return None
+
+    async def _run_commit_flow(self, data: Dict[str, Any], mark_locked: bool):
+        """Run the lock/commit pipeline and write the HTTP response."""
+        status, payload = await self._commit_one(data, mark_locked)
+        if status != 200:
+            self.set_status(status)
+        self.write_json(payload)
+
+    async def _commit_one(
+        self,
+        data: Dict[str, Any],
+        mark_locked: bool,
+        precheck_gpg: bool = True,
+    ):
+        """Shared lock/commit pipeline.
+
+        Both the lock and commit endpoints run the same sequence: probe
+        repository and user, hash the content, embed signature metadata,
+        make a single signed commit and respond. Locking additionally
+        enforces the GPG preconditions, marks the notebook locked and
+        rolls back commits that come back unsigned. Keeping one
+        implementation means every optimization applies to both, and
+        returning (status, payload) instead of writing directly lets the
+        bulk endpoint reuse it per item.
+
+        Args:
+            data: Parsed request body (or one batch item)
+            mark_locked: True for the lock endpoint, False for plain commit
+            precheck_gpg: Set False when the caller already ran the GPG
+                precheck for a whole batch
+
+        Returns:
+            Tuple of (HTTP status code, response payload dict)
+        """
+        op_name = "lock" if mark_locked else "commit"
+        notebook_path = data.get("notebook_path")
+        notebook_content = data.get("notebook_content")
+        commit_message = data.get("commit_message")
+
+        if not notebook_path or not notebook_content:
+            return 400, {"error": "Missing notebook_path or notebook_content"}
+
+        if not commit_message:
+            return 400, {"error": f"Missing commit_message for {op_name} operation"}
+
+        abs_notebook_path = self._resolve_path(notebook_path)
+
+        # A plain commit requires the file on disk; a lock writes the file
+        # itself before committing.
+        if not mark_locked and not os.path.exists(abs_notebook_path):
+            return 400, {"error": f"File does not exist: {abs_notebook_path}"}
+
+        # Start hashing the content in a worker thread now: it depends
+        # only on the request body, so it can overlap the repository
+        # probe and (for locks) the GPG precheck subprocesses below.
+        hash_task = asyncio.create_task(
+            asyncio.to_thread(
+                self.notebook_service.generate_content_hash, notebook_content
             )
-            if not save_success:
-                self.write_error_json(
-                    500,
-                    "Failed to save notebook before committing.",
-                )
-                return
-            logger.info("LockNotebookHandler: Notebook saved successfully.")
+        )
+
+        # Check git repository membership and user configuration in a
+        # single cached probe.
+        repo_probe = await self.git_service.probe(abs_notebook_path)
+        user_info = None
+        if repo_probe["user_name"] and repo_probe["user_email"]:
+            user_info = {
+                "name": repo_probe["user_name"],
+                "email": repo_probe["user_email"],
+            }
 
-            # Step 3: Commit the clean notebook file. This creates the commit that
-            # locks the core content.
-            logger.info("LockNotebookHandler: Step 3: Creating initial git commit...")
-            (
-                commit_success,
-                commit_hash,
-                commit_error,
-            ) = self.git_service.commit_and_sign_file(abs_notebook_path, commit_message)
-            if not commit_success or not commit_hash:
-                logger.error(
-                    "LockNotebookHandler: Initial git commit failed: %s",
-                    commit_error,
+        if not repo_probe["is_repo"]:
+            hash_task.cancel()
+            return 400, {
+                "error": (
+                    "Notebook is not in a git repository. Please initialize "
+                    "git repository first."
                 )
-                self.write_error_json(
-                    500,
-                    f"Failed to commit notebook: {commit_error}",
-                )
-                return
-            logger.info(
-                "LockNotebookHandler: Initial commit successful. Hash: %s",
-                commit_hash,
-            )
+            }
 
-            # Step 4: Get the information from the commit we just created.
-            logger.info("LockNotebookHandler: Step 4: Getting commit information...")
-            commit_info = self.git_service.get_commit_info(
-                abs_notebook_path, commit_hash
-            )
-            if not commit_info:
-                logger.error(
-                    "LockNotebookHandler: Failed to get commit information "
-                    "after commit."
-                )
-                self.write_error_json(
-                    500,
-                    "Failed to get commit information.",
+        if not user_info:
+            hash_task.cancel()
+            return 400, {
+                "error": (
+                    "Git user configuration not found. Please configure git "
+                    "user.name and user.email"
                 )
-                return
-            is_signed = commit_info.get("signed", False)
-            logger.info(
-                "LockNotebookHandler: Commit info retrieved. Signed: %s",
-                is_signed,
-            )
+            }
 
-            # MANDATORY GPG SIGNATURE ENFORCEMENT: Verify commit was actually signed
-            logger.info(
-                "LockNotebookHandler: ===== POST-COMMIT GPG SIGNATURE "
-                "VERIFICATION ====="
+        if mark_locked and precheck_gpg:
+            gpg_error = await self._gpg_precondition_error()
+            if gpg_error:
+                hash_task.cancel()
+                return 400, {"error": gpg_error}
+
+        # Collect the content hash computed concurrently above.
+        content_hash = await hash_task
+
+        # Build the signature metadata and save the notebook with it
+        # embedded, so the single commit below captures the final file
+        # state. The commit hash is intentionally not stored in the
+        # committed file - it cannot be known before the commit exists.
+        # It is returned to the frontend and recovered from git history
+        # when needed, which removes the old save-again-and-amend step.
+        timestamp = self.notebook_service.get_current_timestamp()
+        signature_metadata = {
+            "user_name": user_info["name"],
+            "user_email": user_info["email"],
+            "timestamp": timestamp,
+            "content_hash": content_hash,
+            "hash_version": self.notebook_service.HASH_VERSION,
+            "commit_message": commit_message,
+        }
+        if mark_locked:
+            signature_metadata["locked"] = True
+        elif (
+            "metadata" in notebook_content
+            and "git_lock_sign" in notebook_content["metadata"]
+        ):
+            # A plain commit preserves other fields of existing metadata
+            existing_metadata = notebook_content["metadata"]["git_lock_sign"].copy()
+            existing_metadata.pop("commit_hash", None)
+            existing_metadata.update(signature_metadata)
+            signature_metadata = existing_metadata
+
+        save_success = self.notebook_service.save_signature_metadata(
+            abs_notebook_path, notebook_content, signature_metadata
+        )
+        if not save_success:
+            return 500, {"error": "Failed to save notebook before committing."}
+
+        # Commit the notebook file and read back the commit information in
+        # a single service call.
+        (
+            commit_success,
+            commit_info,
+            commit_error,
+        ) = await self.git_service.commit_sign_and_describe(
+            abs_notebook_path, commit_message
+        )
+        if not commit_success or not commit_info:
+            logger.error("Git commit failed for %s: %s", op_name, commit_error)
+            return 500, {"error": f"Failed to commit notebook: {commit_error}"}
+        commit_hash = commit_info["hash"]
+        self.git_service.invalidate_cache(abs_notebook_path)
+
+        is_signed = commit_info.get("signed", False)
+
+        # MANDATORY GPG SIGNATURE ENFORCEMENT (lock only): verify the
+        # commit was actually signed, rolling it back otherwise.
+        if mark_locked and not is_signed:
+            logger.error(
+                "LockNotebookHandler: ❌ CRITICAL: "
+                "Commit was created but NOT signed - rolling back!"
             )
-            if not is_signed:
-                logger.error(
-                    "LockNotebookHandler: ❌ CRITICAL: "
-                    "Commit was created but NOT signed - rolling back!"
-                )
-                logger.error(
-                    "LockNotebookHandler: Locking requires GPG signatures "
-                    "but commit lacks signature"
-                )
+            (
+                rollback_success,
+                rollback_error,
+            ) = await self.git_service.rollback_last_commit(abs_notebook_path)
 
-                # Rollback the commit since it doesn't meet our requirements
+            if rollback_success:
                 logger.info(
-                    "LockNotebookHandler: Attempting to rollback unsigned commit..."
-                )
-                (
-                    rollback_success,
-                    rollback_error,
-                ) = self.git_service.rollback_last_commit(abs_notebook_path)
-
-                if rollback_success:
-                    logger.info(
-                        "LockNotebookHandler: ✅ Successfully rolled back "
-                        "unsigned commit"
+                    "LockNotebookHandler: ✅ Successfully rolled back "
+                    "unsigned commit"
+                )
+                return 400, {
+                    "error": (
+                        "Cannot lock notebook: GPG signature is required "
+                        "but the commit was not signed. Please ensure your "
+                        "GPG key is properly configured and accessible. The "
+                        "unsigned commit has been rolled back."
                     )
-                    self.write_error_json(
-                        400,
-                        (
-                            "Cannot lock notebook: GPG signature is required "
-                            "but the commit was not signed. Please ensure your "
-                            "GPG key is properly configured and accessible. The "
-                            "unsigned commit has been rolled back."
-                        ),
-                    )
-                else:
-                    logger.error(
-                        "LockNotebookHandler: ❌ Failed to rollback unsigned "
-                        "commit: %s",
-                        rollback_error,
-                    )
-                    self.write_error_json(
-                        500,
-                        (
-                            "CRITICAL ERROR: Commit was created without "
-                            "required GPG signature and rollback failed. "
-                            "Manual intervention required. Rollback error: "
-                            f"{rollback_error}"
-                        ),
-                    )
-                return
-
-            logger.info(
-                "LockNotebookHandler: ✅ POST-COMMIT VERIFICATION PASSED - "
-                "Commit is properly signed"
+                }
+            logger.error(
+                "LockNotebookHandler: ❌ Failed to rollback unsigned "
+                "commit: %s",
+                rollback_error,
             )
+            return 500, {
+                "error": (
+                    "CRITICAL ERROR: Commit was created without "
+                    "required GPG signature and rollback failed. "
+                    "Manual intervention required. Rollback error: "
+                    f"{rollback_error}"
+                )
+            }
 
-            # Step 5: Create the final, complete signature metadata dictionary.
-            logger.info(
-                "LockNotebookHandler: Step 5: Creating final signature " "metadata..."
-            )
-            signature_metadata = {
-                "locked": True,
+        # Complete the metadata for the response with the actual commit
+        # information. The frontend keeps this (including the commit hash)
+        # in its notebook model; the committed file itself only carries
+        # the pre-commit fields.
+        signature_metadata.update(
+            {
                 "commit_hash": commit_hash,
                 "commit_signed": is_signed,
                 "user_name": commit_info.get("author_name", user_info["name"]),
                 "user_email": commit_info.get("author_email", user_info["email"]),
-                "timestamp": commit_info.get(
-                    "timestamp", self.notebook_service.get_current_timestamp()
+                "timestamp": commit_info.get("timestamp", timestamp),
+                "commit_message": commit_info.get("message", commit_message),
+            }
+        )
+
+        logger.info(
+            "%s operation completed successfully for: %s, commit: %s, signed: %s",
+            op_name.capitalize(),
+            notebook_path,
+            commit_hash,
+            is_signed,
+        )
+
+        if mark_locked:
+            signature_metadata["gpg_available"] = is_signed
+            return 200, {
+                "success": True,
+                "message": (
+                    "Notebook locked and signed with git commit " "successfully"
                 ),
-                "content_hash": content_hash,  # The hash of the core content
-                "commit_message": commit_info.get("message", ""),
-                "gpg_available": is_signed,
+                "metadata": signature_metadata,
+                "commit_hash": commit_hash,
+                "signed": is_signed,
             }
-            logger.info(
-                "LockNotebookHandler: Final metadata created: %s",
-                signature_metadata,
-            )
 
-            # Step 6: Save the notebook again, this time with the final signature
-            # metadata.
-            logger.info(
-                "LockNotebookHandler: Step 6: Saving notebook with final " "metadata..."
-            )
-            save_with_meta_success = self.notebook_service.save_signature_metadata(
-                abs_notebook_path, notebook_content, signature_metadata
-            )
-            if not save_with_meta_success:
-                logger.error(
-                    "LockNotebookHandler: Failed to save notebook with final "
-                    "metadata."
-                )
-                self.write_error_json(
-                    500,
-                    "Failed to save notebook with signature metadata.",
-                )
+        signed = "with GPG signature" if is_signed else "without GPG signature"
+        return 200, {
+            "success": True,
+            "message": f"Notebook committed successfully {signed}",
+            "commit_hash": commit_hash,
+            "signed": is_signed,
+        }
+
+
+class LockNotebookHandler(BaseGitLockSignHandler):
+    """Handler for locking and signing notebooks with git commits."""
+
+    async def post(self):
+        """Lock and sign a notebook using git commit signing."""
+        try:
+            data = self.load_json_body()
+            await self._run_commit_flow(data, mark_locked=True)
+        except HTTPError:
+            # Intentional HTTP errors (e.g. the 413 from load_json_body)
+            # must reach the client as-is, not as a rewritten 500.
+            raise
+        except json.JSONDecodeError:
+            self.write_error_bytes(400, _ERR_INVALID_JSON)
+        except Exception as e:
+            logger.error("Error locking notebook: %s", str(e))
+            self.write_error_json(500, f"Internal server error: {str(e)}")
+
+
+class BulkLockNotebookHandler(BaseGitLockSignHandler):
+    """Handler for locking a batch of notebooks in one request.
+
+    The GPG preconditions are validated once per batch and the per-item
+    pipelines then run concurrently, so the subprocess costs are paid
+    once instead of once per notebook. Commit concurrency stays bounded
+    by the GitService semaphore and per-repository write locks.
+    """
+
+    # Bound on items processed concurrently; keeps hashing threads and
+    # notebook writes from piling up on very large batches.
+    MAX_PARALLEL_ITEMS = 4
+
+    async def post(self):
+        """Lock and sign every notebook in the submitted batch."""
+        try:
+            data = self.load_json_body()
+            items = data.get("items")
+            if not isinstance(items, list) or not items:
+                self.write_error_json(400, "Missing or empty items list")
                 return
-            logger.info(
-                "LockNotebookHandler: Successfully saved notebook with final "
-                "metadata."
-            )
 
-            # Step 7: Amend the previous commit to include the file with the new
-            # metadata.
-            # This keeps the repository clean (one commit per lock) and ensures the
-            # committed state matches the file on disk.
-            logger.info(
-                "LockNotebookHandler: Step 7: Amending commit to include " "metadata..."
-            )
-            (
-                amend_success,
-                new_commit_hash,
-                amend_error,
-            ) = self.git_service.amend_commit_with_file(
-                abs_notebook_path, commit_message
-            )
-            if not amend_success or not new_commit_hash:
-                logger.warning(
-                    "LockNotebookHandler: Failed to amend commit: %s. The file "
-                    "is locked but the commit does not contain the signature "
-                    "metadata.",
-                    amend_error,
-                )
-                # Don't fail the whole operation, but the state is not ideal.
-            else:
-                logger.info(
-                    "LockNotebookHandler: Successfully amended commit. New " "hash: %s",
-                    new_commit_hash,
-                )
-                # Update metadata for the response
-                commit_hash = new_commit_hash
-                signature_metadata["commit_hash"] = new_commit_hash
+            gpg_error = await self._gpg_precondition_error()
+            if gpg_error:
+                self.write_error_json(400, gpg_error)
+                return
 
-            logger.info("Lock operation completed successfully for: %s", notebook_path)
+            semaphore = asyncio.Semaphore(self.MAX_PARALLEL_ITEMS)
 
+            async def lock_one(item: Any) -> Dict[str, Any]:
+                if not isinstance(item, dict):
+                    return {
+                        "success": False,
+                        "error": "Each item must be an object",
+                        "notebook_path": None,
+                    }
+                async with semaphore:
+                    status, payload = await self._commit_one(
+                        item, mark_locked=True, precheck_gpg=False
+                    )
+                payload.setdefault("success", status == 200)
+                payload["notebook_path"] = item.get("notebook_path")
+                return payload
+
+            results = await asyncio.gather(*(lock_one(item) for item in items))
             self.write_json(
                 {
-                    "success": True,
-                    "message": (
-                        "Notebook locked and signed with git commit " "successfully"
-                    ),
-                    "metadata": signature_metadata,
-                    "commit_hash": commit_hash,
-                    "signed": is_signed,
+                    "success": all(result["success"] for result in results),
+                    "results": results,
                 }
             )
-
+        except HTTPError:
+            # Intentional HTTP errors (e.g. the 413 from load_json_body)
+            # must reach the client as-is, not as a rewritten 500.
+            raise
         except json.JSONDecodeError:
-            self.write_error_json(400, "Invalid JSON in request body")
+            self.write_error_bytes(400, _ERR_INVALID_JSON)
         except Exception as e:
-            logger.error("Error locking notebook: %s", str(e))
+            logger.error("Error bulk-locking notebooks: %s", str(e))
             self.write_error_json(500, f"Internal server error: {str(e)}")
 
 
@@ -400,23 +540,30 @@ class UnlockNotebookHandler(BaseGitLockSignHandler):
     async def post(self):
         """Unlock a notebook after verifying git commit signature."""
         try:
-            logger.info("=== UnlockNotebookHandler: Starting unlock process ===")
+            logger.debug("=== UnlockNotebookHandler: Starting unlock process ===")
 
             # Get request data
-            logger.info("UnlockNotebookHandler: Parsing request data...")
-            data = json.loads(self.request.body.decode("utf-8"))
+            logger.debug("UnlockNotebookHandler: Parsing request data...")
+            data = self.load_json_body()
+            # Bind the shared service singletons to locals once; every
+            # self.X below is a property doing a settings lookup, and the
+            # unlock body references them dozens of times.
+            git_service = self.git_service
+            gpg_service = self.gpg_service
+            notebook_service = self.notebook_service
+            user_service = self.user_service
             notebook_path = data.get("notebook_path")
             notebook_content = data.get("notebook_content")
 
-            logger.info(
+            logger.debug(
                 "UnlockNotebookHandler: Received request for notebook: %s",
                 notebook_path,
             )
-            logger.info(
+            logger.debug(
                 "UnlockNotebookHandler: Notebook content size: %s characters",
                 len(str(notebook_content)) if notebook_content else 0,
             )
-            logger.info(
+            logger.debug(
                 "UnlockNotebookHandler: Notebook content type: %s",
                 type(notebook_content),
             )
@@ -431,54 +578,65 @@ class UnlockNotebookHandler(BaseGitLockSignHandler):
                     "UnlockNotebookHandler: notebook_content present: %s",
                     bool(notebook_content),
                 )
-                self.write_error_json(400, "Missing notebook_path or notebook_content")
+                self.write_error_bytes(400, _ERR_MISSING_PARAMS)
                 return
 
-            # Convert relative path to absolute path
-            abs_notebook_path = os.path.abspath(notebook_path)
-            logger.info("UnlockNotebookHandler: Absolute path: %s", abs_notebook_path)
-            logger.info(
+            # Validate the payload shape once; the rest of the handler can
+            # then index into it without re-checking types on every access.
+            if not isinstance(notebook_content, dict):
+                logger.error(
+                    "UnlockNotebookHandler: notebook_content is not an object"
+                )
+                self.write_error_json(400, "notebook_content must be a JSON object")
+                return
+            meta = notebook_content.get("metadata")
+            if not isinstance(meta, dict):
+                meta = None
+
+            # Resolve the path once and hoist the basename used in the
+            # unlock commit message.
+            abs_notebook_path = self._resolve_path(notebook_path)
+            nb_basename = os.path.basename(abs_notebook_path)
+            logger.debug("UnlockNotebookHandler: Absolute path: %s", abs_notebook_path)
+            logger.debug(
                 "UnlockNotebookHandler: File exists: %s",
                 os.path.exists(abs_notebook_path),
             )
 
             # Check if file is in a git repository
-            logger.info("UnlockNotebookHandler: Checking git repository status...")
-            is_git_repo = self.git_service.is_git_repository(abs_notebook_path)
-            logger.info("UnlockNotebookHandler: Is git repository: %s", is_git_repo)
+            logger.debug("UnlockNotebookHandler: Checking git repository status...")
+            is_git_repo = await git_service.is_git_repository(abs_notebook_path)
+            logger.debug("UnlockNotebookHandler: Is git repository: %s", is_git_repo)
 
             if not is_git_repo:
                 logger.error(
                     "UnlockNotebookHandler: Not in git repository: %s",
                     abs_notebook_path,
                 )
-                self.write_error_json(400, "Notebook is not in a git repository")
+                self.write_error_bytes(400, _ERR_NOT_GIT_REPO)
                 return
 
-            # Get repository status for debugging
-            repo_status = self.git_service.get_repository_status(abs_notebook_path)
-            logger.info("UnlockNotebookHandler: Repository status: %s", repo_status)
-
             # Get existing signature metadata
-            logger.info("UnlockNotebookHandler: Extracting signature metadata...")
-            logger.info(
-                "UnlockNotebookHandler: Notebook has 'metadata' key: %s",
-                "metadata" in notebook_content,
-            )
-            if "metadata" in notebook_content:
-                logger.info(
-                    "UnlockNotebookHandler: Metadata keys: %s",
-                    list(notebook_content["metadata"].keys()),
-                )
-                logger.info(
-                    "UnlockNotebookHandler: Has 'git_lock_sign' metadata: %s",
-                    "git_lock_sign" in notebook_content["metadata"],
-                )
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("UnlockNotebookHandler: Extracting signature metadata...")
+                logger.debug(
+                    "UnlockNotebookHandler: Notebook has 'metadata' key: %s",
+                    meta is not None,
+                )
+                if meta is not None:
+                    logger.debug(
+                        "UnlockNotebookHandler: Metadata keys: %s", meta.keys()
+                    )
+                    logger.debug(
+                        "UnlockNotebookHandler: Has 'git_lock_sign' metadata: %s",
+                        "git_lock_sign" in meta,
+                    )
 
-            signature_metadata = self.notebook_service.get_signature_metadata(
-                notebook_content
-            )
-            logger.info(
+            # Probe the already-bound metadata mapping directly; a notebook
+            # that was never locked short-circuits here without another
+            # service call.
+            signature_metadata = meta.get("git_lock_sign") if meta else None
+            logger.debug(
                 "UnlockNotebookHandler: Signature metadata extracted: %s",
                 signature_metadata is not None,
             )
@@ -487,276 +645,214 @@ class UnlockNotebookHandler(BaseGitLockSignHandler):
                 logger.error(
                     "UnlockNotebookHandler: No signature metadata found in notebook"
                 )
-                self.write_error_json(400, "No signature found in notebook")
+                self.write_error_bytes(400, _ERR_NO_SIGNATURE)
                 return
 
-            logger.info(
+            logger.debug(
                 "UnlockNotebookHandler: Signature metadata contents: %s",
                 signature_metadata,
             )
 
-            # Get commit hash from metadata
-            commit_hash = signature_metadata.get("commit_hash")
-            logger.info(
-                "UnlockNotebookHandler: Commit hash from metadata: %s",
-                commit_hash,
-            )
+            logger.debug("UnlockNotebookHandler: ===== USER IDENTITY VALIDATION =====")
 
-            if not commit_hash:
+            # Validate the unlocking user before any hashing or signature
+            # verification: the identity comparison is the cheapest check,
+            # so an unauthorized unlock short-circuits without paying for a
+            # content hash or a gpg fork.
+            unlocking_user = await user_service.get_user_info()
+            if not unlocking_user:
                 logger.error(
-                    "UnlockNotebookHandler: No commit hash found in signature metadata"
+                    "UnlockNotebookHandler: Could not get current git user "
+                    "configuration"
                 )
                 self.write_error_json(
-                    400, "No git commit hash found in signature metadata"
+                    400,
+                    "Could not identify unlocking user. "
+                    "Please configure git user.name and user.email.",
                 )
                 return
 
-            # Check if the notebook was originally signed with GPG
-            was_gpg_signed = signature_metadata.get("commit_signed", False)
-            logger.info(
-                "UnlockNotebookHandler: Notebook was originally GPG signed: %s",
-                was_gpg_signed,
-            )
+            # Bind the identity fields once; they are compared and logged
+            # several times across the validation branches below.
+            current_user_name = unlocking_user["name"]
+            current_user_email = unlocking_user["email"]
 
-            # Log all metadata fields for debugging
-            logger.info("UnlockNotebookHandler: All signature metadata fields:")
-            for key, value in signature_metadata.items():
-                logger.info("  %s: %s", key, value)
-
-            # Verify content integrity first
-            logger.info("UnlockNotebookHandler: ===== CONTENT HASH VERIFICATION =====")
-            logger.info("UnlockNotebookHandler: Starting content hash verification...")
-
-            # Log notebook structure for debugging
-            logger.info("UnlockNotebookHandler: Notebook structure analysis:")
-            logger.info(
-                "  - Top-level keys: %s",
-                list(notebook_content.keys())
-                if isinstance(notebook_content, dict)
-                else "Not a dict",
+            logger.debug(
+                "UnlockNotebookHandler: Current user: %s <%s>",
+                current_user_name,
+                current_user_email,
             )
-            if isinstance(notebook_content, dict) and "cells" in notebook_content:
-                logger.info("  - Number of cells: %s", len(notebook_content["cells"]))
-            if isinstance(notebook_content, dict) and "metadata" in notebook_content:
-                logger.info(
-                    "  - Metadata keys: %s",
-                    list(notebook_content["metadata"].keys()),
-                )
-                if "git_lock_sign" in notebook_content["metadata"]:
-                    git_metadata = notebook_content["metadata"]["git_lock_sign"]
-                    logger.info(
-                        "  - git_lock_sign metadata keys: %s",
-                        list(git_metadata.keys()),
-                    )
-
-            # Calculate current hash
-            logger.info("UnlockNotebookHandler: Calculating current content hash...")
-
-            # First, let's examine the content being hashed in detail
-            logger.info("UnlockNotebookHandler: Analyzing content for hashing...")
 
-            # Log the content preparation process
-            import copy
+            # Get original signer information from metadata
+            original_user_name = signature_metadata.get("user_name")
+            original_user_email = signature_metadata.get("user_email")
 
-            content_for_hash = copy.deepcopy(notebook_content)
-            logger.info(
-                "UnlockNotebookHandler: Original content keys: %s",
-                list(content_for_hash.keys()),
+            logger.debug(
+                "UnlockNotebookHandler: Original signer: %s <%s>",
+                original_user_name,
+                original_user_email,
             )
 
-            # Remove git_lock_sign metadata like the service does
+            # Validate that current user matches original signer
             if (
-                "metadata" in content_for_hash
-                and "git_lock_sign" in content_for_hash["metadata"]
+                current_user_name != original_user_name
+                or current_user_email != original_user_email
             ):
-                logger.info(
-                    "UnlockNotebookHandler: Removing git_lock_sign metadata "
-                    "for hash calculation"
+                logger.error(
+                    "UnlockNotebookHandler: ❌ User identity mismatch - unlock denied"
                 )
-                del content_for_hash["metadata"]["git_lock_sign"]
-
-            # Log remaining metadata
-            if "metadata" in content_for_hash:
-                logger.info(
-                    "UnlockNotebookHandler: Remaining metadata keys: %s",
-                    list(content_for_hash["metadata"].keys()),
+                logger.error(
+                    "UnlockNotebookHandler: Current user: %s <%s>",
+                    current_user_name,
+                    current_user_email,
+                )
+                logger.error(
+                    "UnlockNotebookHandler: Original signer: %s <%s>",
+                    original_user_name,
+                    original_user_email,
                 )
-                for key, value in content_for_hash["metadata"].items():
-                    logger.info(
-                        "  - %s: %s",
-                        key,
-                        str(value)[:100] + ("..." if len(str(value)) > 100 else ""),
-                    )
 
-            # Log cell information
-            if "cells" in content_for_hash:
-                logger.info(
-                    "UnlockNotebookHandler: Number of cells: %s",
-                    len(content_for_hash["cells"]),
+                self.write_error_json(
+                    403,
+                    (
+                        f"Cannot unlock: Current git user ({current_user_name} "
+                        f"<{current_user_email}>) does not match "
+                        f"original signer ({original_user_name} "
+                        f"<{original_user_email}>). Only the original signer can "
+                        "unlock this notebook."
+                    ),
                 )
-                for i, cell in enumerate(
-                    content_for_hash["cells"][:3]
-                ):  # Log first 3 cells
-                    logger.info("UnlockNotebookHandler: Cell %s:", i)
-                    logger.info("  - Type: %s", cell.get("cell_type", "unknown"))
-                    logger.info("  - Execution count: %s", cell.get("execution_count"))
-                    if "metadata" in cell:
-                        logger.info(
-                            "  - Cell metadata keys: %s",
-                            list(cell["metadata"].keys()),
-                        )
-                    if "source" in cell:
-                        source_preview = str(cell["source"])[:100]
-                        logger.info(
-                            "  - Source preview: %s",
-                            source_preview
-                            + ("..." if len(str(cell["source"])) > 100 else ""),
-                        )
+                return
 
-            # Generate the hash
-            current_hash = self.notebook_service.generate_content_hash(notebook_content)
-            stored_hash = signature_metadata.get("content_hash")
+            logger.debug(
+                "UnlockNotebookHandler: ✅ User identity validation passed - "
+                "current user matches original signer"
+            )
 
-            logger.info("UnlockNotebookHandler: Content hash comparison:")
-            logger.info("  - Stored hash:  %s", stored_hash)
-            logger.info("  - Current hash: %s", current_hash)
-            logger.info("  - Hashes match: %s", current_hash == stored_hash)
+            # Get commit hash from metadata
+            commit_hash = signature_metadata.get("commit_hash")
+            logger.debug(
+                "UnlockNotebookHandler: Commit hash from metadata: %s",
+                commit_hash,
+            )
 
-            if current_hash != stored_hash:
-                logger.warning(
-                    "UnlockNotebookHandler: ===== HASH MISMATCH DETECTED ====="
+            if not commit_hash:
+                # Notebooks locked without an amend do not store the commit
+                # hash in the file; recover it from git history instead.
+                commit_hash = await git_service.get_last_commit_for_file(
+                    abs_notebook_path
                 )
-                logger.warning(
-                    (
-                        "UnlockNotebookHandler: Content hash mismatch - stored: %s, "
-                        "current: %s"
-                    ),
-                    stored_hash,
-                    current_hash,
+                logger.debug(
+                    "UnlockNotebookHandler: Commit hash from git history: %s",
+                    commit_hash,
                 )
-                logger.warning(
-                    "UnlockNotebookHandler: This may be due to "
-                    "the reload process changing the notebook content"
+
+            if not commit_hash:
+                logger.error(
+                    "UnlockNotebookHandler: No commit hash found in signature metadata"
                 )
-                logger.warning(
-                    "UnlockNotebookHandler: Attempting to recalculate hash "
-                    "after removing metadata..."
+                self.write_error_json(
+                    400, "No git commit hash found in signature metadata"
                 )
+                return
 
-                # Try to recalculate the hash by temporarily removing the metadata
-                import copy
+            # One git log read supplies the commit metadata and signature
+            # details (author, timestamp, %G? status, signing key) that
+            # both verification branches below consume.
+            commit_full_info = await git_service.get_commit_full_info(
+                abs_notebook_path, commit_hash
+            )
 
-                logger.info(
-                    "UnlockNotebookHandler: Creating deep copy of notebook "
-                    "content for hash recalculation..."
-                )
-                temp_content = copy.deepcopy(notebook_content)
+            # Check if the notebook was originally signed with GPG
+            was_gpg_signed = signature_metadata.get("commit_signed", False)
+            logger.debug(
+                "UnlockNotebookHandler: Notebook was originally GPG signed: %s",
+                was_gpg_signed,
+            )
 
-                logger.info(
-                    "UnlockNotebookHandler: Checking for git_lock_sign "
-                    "metadata to remove..."
-                )
-                metadata_removed = False
-                if (
-                    "metadata" in temp_content
-                    and "git_lock_sign" in temp_content["metadata"]
-                ):
-                    logger.info(
-                        "UnlockNotebookHandler: Removing git_lock_sign "
-                        "metadata from temporary content..."
-                    )
-                    del temp_content["metadata"]["git_lock_sign"]
-                    metadata_removed = True
-                    logger.info(
-                        "UnlockNotebookHandler: git_lock_sign metadata "
-                        "removed successfully"
-                    )
-                else:
-                    logger.warning(
-                        "UnlockNotebookHandler: No git_lock_sign metadata "
-                        "found to remove"
-                    )
+            # Log all metadata fields for debugging
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("UnlockNotebookHandler: All signature metadata fields:")
+                for key, value in signature_metadata.items():
+                    logger.debug("  %s: %s", key, value)
 
-                logger.info(
-                    "UnlockNotebookHandler: Metadata removal performed: %s",
-                    metadata_removed,
+            # Verify content integrity first
+            logger.debug("UnlockNotebookHandler: ===== CONTENT HASH VERIFICATION =====")
+            logger.debug("UnlockNotebookHandler: Starting content hash verification...")
+
+            # Calculate current hash with the scheme the signature was
+            # created with. The git_lock_sign block is popped and restored
+            # around the computation instead of deep-copying the whole
+            # notebook just to strip one key; this also collapses the old
+            # "hash, then re-hash without metadata" fallback into a single
+            # computation over exactly the content that was signed.
+            logger.debug("UnlockNotebookHandler: Calculating current content hash...")
+            stored_hash_version = signature_metadata.get("hash_version", 1)
+            saved_gls = meta.pop("git_lock_sign", None) if meta else None
+            try:
+                current_hash = await asyncio.to_thread(
+                    notebook_service.generate_content_hash,
+                    notebook_content,
+                    stored_hash_version,
+                )
+            finally:
+                if saved_gls is not None:
+                    meta["git_lock_sign"] = saved_gls
+            stored_hash = signature_metadata.get("content_hash")
+
+            logger.debug("UnlockNotebookHandler: Content hash comparison:")
+            logger.debug("  - Stored hash:  %s", stored_hash)
+            logger.debug("  - Current hash: %s", current_hash)
+
+            if current_hash != stored_hash:
+                logger.error(
+                    "UnlockNotebookHandler: ❌ Content hash mismatch - the "
+                    "notebook content has been modified since locking"
                 )
-                logger.info(
-                    "UnlockNotebookHandler: Recalculating hash with cleaned "
-                    "content..."
+                logger.error("UnlockNotebookHandler: Expected: %s", stored_hash)
+                logger.error("UnlockNotebookHandler: Got:      %s", current_hash)
+                self.write_error_json(
+                    400,
+                    "Content has been modified since locking. Cannot unlock.",
                 )
+                return
 
-                recalc_hash = self.notebook_service.generate_content_hash(temp_content)
-                logger.info("UnlockNotebookHandler: Hash recalculation results:")
-                logger.info("  - Original stored hash: %s", stored_hash)
-                logger.info("  - Hash with metadata:    %s", current_hash)
-                logger.info("  - Hash without metadata: %s", recalc_hash)
-                logger.info("  - Recalc matches stored: %s", recalc_hash == stored_hash)
-
-                if recalc_hash == stored_hash:
-                    logger.info(
-                        "UnlockNotebookHandler: ✅ Hash matches after removing "
-                        "metadata - proceeding with unlock"
-                    )
-                    current_hash = recalc_hash  # Use the corrected hash
-                else:
-                    logger.error(
-                        "UnlockNotebookHandler: ❌ Hash still doesn't match "
-                        "after recalculation"
-                    )
-                    logger.error(
-                        "UnlockNotebookHandler: This indicates the notebook "
-                        "content has been genuinely modified"
-                    )
-                    logger.error("UnlockNotebookHandler: Expected: %s", stored_hash)
-                    logger.error("UnlockNotebookHandler: Got:      %s", recalc_hash)
-                    logger.error(
-                        "UnlockNotebookHandler: Difference: Content may have "
-                        "been modified since locking"
-                    )
-                    self.write_error_json(
-                        400,
-                        "Content has been modified since locking. Cannot unlock.",
-                    )
-                    return
-            else:
-                logger.info(
-                    "UnlockNotebookHandler: ✅ Content hash verification "
-                    "passed on first attempt"
-                )
+            logger.debug(
+                "UnlockNotebookHandler: ✅ Content hash verification passed"
+            )
 
-            logger.info("UnlockNotebookHandler: ===== SIGNATURE VERIFICATION =====")
+            logger.debug("UnlockNotebookHandler: ===== SIGNATURE VERIFICATION =====")
 
             # If the notebook was GPG signed, try to verify the signature
             signature_verification_passed = True
             unlock_message = "Notebook unlocked successfully"
 
             if was_gpg_signed:
-                logger.info(
+                logger.debug(
                     "UnlockNotebookHandler: Notebook was GPG signed, "
                     "verifying signature..."
                 )
-                logger.info("UnlockNotebookHandler: Verifying commit: %s", commit_hash)
+                logger.debug("UnlockNotebookHandler: Verifying commit: %s", commit_hash)
 
                 (
                     signature_valid,
                     verify_error,
-                ) = self.git_service.verify_commit_signature(
+                ) = await git_service.verify_commit_signature(
                     abs_notebook_path, commit_hash
                 )
 
-                logger.info(
+                logger.debug(
                     "UnlockNotebookHandler: GPG signature verification results:"
                 )
-                logger.info("  - Signature valid: %s", signature_valid)
-                logger.info("  - Verify error: %s", verify_error)
+                logger.debug("  - Signature valid: %s", signature_valid)
+                logger.debug("  - Verify error: %s", verify_error)
 
                 if signature_valid:
                     unlock_message = (
                         "Notebook unlocked successfully after GPG signature "
                         "verification"
                     )
-                    logger.info(
+                    logger.debug(
                         "UnlockNotebookHandler: ✅ GPG signature verified "
                         "for unlock: %s",
                         notebook_path,
@@ -774,128 +870,73 @@ class UnlockNotebookHandler(BaseGitLockSignHandler):
                     )
                     signature_verification_passed = False
             else:
-                logger.info(
+                logger.debug(
                     "UnlockNotebookHandler: Notebook was not GPG signed "
                     "originally, verifying git commit exists..."
                 )
-                logger.info(
+                logger.debug(
                     "UnlockNotebookHandler: Checking commit info for: %s",
                     commit_hash,
                 )
-
-                commit_info = self.git_service.get_commit_info(
-                    abs_notebook_path, commit_hash
-                )
-                logger.info(
-                    "UnlockNotebookHandler: Commit info retrieved: %s",
-                    commit_info is not None,
-                )
-
-                if commit_info:
-                    logger.info("UnlockNotebookHandler: Commit info: %s", commit_info)
-                    unlock_message = (
-                        "Notebook unlocked successfully (was not GPG signed)"
-                    )
-                    logger.info(
-                        "UnlockNotebookHandler: ✅ Unlocking notebook that "
-                        "was not GPG signed: %s",
-                        notebook_path,
-                    )
-                else:
-                    logger.error(
-                        "UnlockNotebookHandler: ❌ Git commit %s not found in "
-                        "repository",
-                        commit_hash,
-                    )
-                    self.write_error_json(
-                        400, f"Git commit {commit_hash} not " "found in repository"
-                    )
-                    return
-
-            logger.info(
-                "UnlockNotebookHandler: ===== UPDATING METADATA FOR UNLOCK ====="
-            )
-
-            logger.info("UnlockNotebookHandler: ===== USER IDENTITY VALIDATION =====")
-
-            # Get current user info to validate against original signer
-            unlocking_user = self.user_service.get_user_info()
-            if not unlocking_user:
-                logger.error(
-                    "UnlockNotebookHandler: Could not get current git user "
-                    "configuration"
-                )
-                self.write_error_json(
-                    400,
-                    "Could not identify unlocking user. "
-                    "Please configure git user.name and user.email.",
-                )
-                return
-
-            logger.info(
-                "UnlockNotebookHandler: Current user: %s <%s>",
-                unlocking_user["name"],
-                unlocking_user["email"],
-            )
-
-            # Get original signer information from metadata
-            original_user_name = signature_metadata.get("user_name")
-            original_user_email = signature_metadata.get("user_email")
-
-            logger.info(
-                "UnlockNotebookHandler: Original signer: %s <%s>",
-                original_user_name,
-                original_user_email,
-            )
-
-            # Validate that current user matches original signer
-            if (
-                unlocking_user["name"] != original_user_name
-                or unlocking_user["email"] != original_user_email
-            ):
-                logger.error(
-                    "UnlockNotebookHandler: ❌ User identity mismatch - unlock denied"
-                )
-                logger.error(
-                    "UnlockNotebookHandler: Current user: %s <%s>",
-                    unlocking_user["name"],
-                    unlocking_user["email"],
-                )
-                logger.error(
-                    "UnlockNotebookHandler: Original signer: %s <%s>",
-                    original_user_name,
-                    original_user_email,
-                )
-
-                self.write_error_json(
-                    403,
-                    (
-                        f"Cannot unlock: Current git user ({unlocking_user['name']} "
-                        f"<{unlocking_user['email']}>) does not match "
-                        f"original signer ({original_user_name} "
-                        f"<{original_user_email}>). Only the original signer can "
-                        "unlock this notebook."
-                    ),
+
+                commit_info = commit_full_info
+                logger.debug(
+                    "UnlockNotebookHandler: Commit info retrieved: %s",
+                    commit_info is not None,
                 )
-                return
 
-            logger.info(
-                "UnlockNotebookHandler: ✅ User identity validation passed - "
-                "current user matches original signer"
+                if commit_info:
+                    logger.debug("UnlockNotebookHandler: Commit info: %s", commit_info)
+                    unlock_message = (
+                        "Notebook unlocked successfully (was not GPG signed)"
+                    )
+                    logger.debug(
+                        "UnlockNotebookHandler: ✅ Unlocking notebook that "
+                        "was not GPG signed: %s",
+                        notebook_path,
+                    )
+                else:
+                    logger.error(
+                        "UnlockNotebookHandler: ❌ Git commit %s not found in "
+                        "repository",
+                        commit_hash,
+                    )
+                    self.write_error_json(
+                        400, f"Git commit {commit_hash} not " "found in repository"
+                    )
+                    return
+
+            logger.debug(
+                "UnlockNotebookHandler: ===== UPDATING METADATA FOR UNLOCK ====="
             )
 
             # Additional GPG key validation for GPG-signed notebooks
             if was_gpg_signed:
-                logger.info(
+                logger.debug(
                     "UnlockNotebookHandler: ===== ENHANCED GPG KEY VALIDATION ====="
                 )
-                logger.info(
+                logger.debug(
                     "UnlockNotebookHandler: Notebook was GPG-signed, "
                     "performing comprehensive key validation..."
                 )
 
+                # The three state probes are independent subprocess-backed
+                # checks, so run them concurrently; when their memoized
+                # answers are still fresh this degenerates to three dict
+                # lookups. The error branches below still fire in the
+                # original order so the user sees the same first failure.
+                (
+                    gpg_available,
+                    has_key,
+                    current_configured_key,
+                ) = await asyncio.gather(
+                    asyncio.to_thread(gpg_service.is_gpg_available),
+                    asyncio.to_thread(gpg_service.has_signing_key),
+                    asyncio.to_thread(gpg_service.get_configured_signing_key),
+                )
+
                 # Step 1: Check if current user has GPG configured and available
-                if not self.gpg_service.is_gpg_available():
+                if not gpg_available:
                     logger.error(
                         "UnlockNotebookHandler: ❌ GPG not available for " "current user"
                     )
@@ -907,7 +948,7 @@ class UnlockNotebookHandler(BaseGitLockSignHandler):
                     )
                     return
 
-                if not self.gpg_service.has_signing_key():
+                if not has_key:
                     logger.error(
                         "UnlockNotebookHandler: ❌ No GPG signing keys "
                         "available for current user"
@@ -921,12 +962,14 @@ class UnlockNotebookHandler(BaseGitLockSignHandler):
                     return
 
                 # Step 2: Extract the key ID that was used to sign the original commit
-                logger.info(
+                logger.debug(
                     "UnlockNotebookHandler: Extracting original signing key "
                     "ID from commit..."
                 )
-                original_signing_key_id = self.git_service.get_commit_signing_key_id(
-                    abs_notebook_path, commit_hash
+                original_signing_key_id = (
+                    commit_full_info.get("signing_key_id")
+                    if commit_full_info
+                    else None
                 )
 
                 if not original_signing_key_id:
@@ -942,18 +985,27 @@ class UnlockNotebookHandler(BaseGitLockSignHandler):
                     )
                     return
 
-                logger.info(
+                logger.debug(
                     "UnlockNotebookHandler: Original commit was signed with " "key: %s",
                     original_signing_key_id,
                 )
 
+                # Hoisted values shared by the error branches below.
+                # Slicing already returns the whole string when it is
+                # shorter than the suffix, so no length checks are needed.
+                user_matches = (
+                    current_user_name == original_user_name
+                    and current_user_email == original_user_email
+                )
+                short_key_id = original_signing_key_id[-4:]
+                short_original_key = original_signing_key_id[-8:]
+
                 # Step 3: Check if current user has the same signing key
                 # configured in git
-                logger.info(
+                logger.debug(
                     "UnlockNotebookHandler: Checking current git signing key "
                     "configuration..."
                 )
-                current_configured_key = self.gpg_service.get_configured_signing_key()
 
                 if not current_configured_key:
                     logger.error(
@@ -961,51 +1013,27 @@ class UnlockNotebookHandler(BaseGitLockSignHandler):
                         "configured for current user"
                     )
 
-                    # Use conditional disclosure with truncated key for security
-                    user_matches = (
-                        unlocking_user["name"] == original_user_name
-                        and unlocking_user["email"] == original_user_email
-                    )
-
-                    if user_matches:
-                        # Safe to show truncated key ID since user identity
-                        # matches
-                        short_key_id = (
-                            original_signing_key_id[-4:]
-                            if len(original_signing_key_id) > 4
-                            else original_signing_key_id
-                        )
-                        error_msg = (
-                            "Cannot unlock GPG-signed notebook: No git "
-                            "signing key configured. Please configure a GPG "
-                            f"key ending in {short_key_id} with: git config "
-                            "user.signingkey [YOUR_KEY_ID]"
-                        )
-                    else:
-                        # Don't reveal key information to non-matching users
-                        error_msg = (
-                            "Cannot unlock GPG-signed notebook: You do not "
-                            "have access to the required GPG key. Please "
-                            "ensure you are the original signer with proper "
-                            "GPG configuration."
-                        )
-
+                    error_msg = _UNLOCK_ERROR_TEMPLATES[
+                        ("no_signing_key", user_matches)
+                    ].format(short_key_id=short_key_id)
                     self.write_error_json(403, error_msg)
                     return
 
-                logger.info(
+                logger.debug(
                     "UnlockNotebookHandler: Current configured signing key: %s",
                     current_configured_key,
                 )
 
                 # Step 4: Verify that the configured key matches the original
-                # signing key
-                # Handle both short and long key ID formats
-                keys_match = (
-                    current_configured_key == original_signing_key_id
-                    or current_configured_key.endswith(original_signing_key_id)
-                    or original_signing_key_id.endswith(current_configured_key)
-                )
+                # signing key. Key IDs are hex suffixes of the fingerprint
+                # (8, 16 or 40 chars), so short-vs-long formats reduce to
+                # checking whether one normalized key is a suffix of the
+                # other.
+                current_key_norm = _norm_key(current_configured_key)
+                original_key_norm = _norm_key(original_signing_key_id)
+                keys_match = current_key_norm.endswith(
+                    original_key_norm
+                ) or original_key_norm.endswith(current_key_norm)
 
                 if not keys_match:
                     logger.error("UnlockNotebookHandler: ❌ Git signing key mismatch")
@@ -1018,57 +1046,27 @@ class UnlockNotebookHandler(BaseGitLockSignHandler):
                         current_configured_key,
                     )
 
-                    # Use conditional disclosure with truncated key for security
-                    user_matches = (
-                        unlocking_user["name"] == original_user_name
-                        and unlocking_user["email"] == original_user_email
+                    error_msg = _UNLOCK_ERROR_TEMPLATES[
+                        ("key_mismatch", user_matches)
+                    ].format(
+                        short_original_key=short_original_key,
+                        short_current_key=current_configured_key[-8:],
                     )
-
-                    if user_matches:
-                        # Safe to show truncated key IDs since user identity matches
-                        short_original_key = (
-                            original_signing_key_id[-8:]
-                            if len(original_signing_key_id) > 8
-                            else original_signing_key_id
-                        )
-                        short_current_key = (
-                            current_configured_key[-8:]
-                            if len(current_configured_key) > 8
-                            else current_configured_key
-                        )
-                        error_msg = (
-                            "Cannot unlock GPG-signed notebook: "
-                            "Git signing key mismatch. "
-                            "Original commit was signed with key ending in "
-                            f"{short_original_key}, but current git "
-                            "configuration uses key ending in "
-                            f"{short_current_key}. Please configure the "
-                            "correct key with: git config user.signingkey "
-                            "[YOUR_KEY_ID]"
-                        )
-                    else:
-                        # Don't reveal key information to non-matching users
-                        error_msg = (
-                            "Cannot unlock GPG-signed notebook: Git signing "
-                            "key configuration does not match. Please ensure "
-                            "you are the original signer with the correct GPG "
-                            "key configured."
-                        )
-
                     self.write_error_json(403, error_msg)
                     return
 
-                logger.info(
+                logger.debug(
                     "UnlockNotebookHandler: ✅ Git signing key configuration "
                     "matches original"
                 )
 
                 # Step 5: Test that the user can actually sign with the original key
-                logger.info(
+                logger.debug(
                     "UnlockNotebookHandler: Testing actual signing capability "
                     "with original key..."
                 )
-                can_sign_with_original_key = self.gpg_service.can_sign_with_key(
+                can_sign_with_original_key = await asyncio.to_thread(
+                    gpg_service.can_sign_with_key,
                     original_signing_key_id
                 )
 
@@ -1077,52 +1075,26 @@ class UnlockNotebookHandler(BaseGitLockSignHandler):
                         "UnlockNotebookHandler: ❌ Cannot sign with original " "GPG key"
                     )
 
-                    # Use conditional disclosure with truncated key for security
-                    user_matches = (
-                        unlocking_user["name"] == original_user_name
-                        and unlocking_user["email"] == original_user_email
-                    )
-
-                    if user_matches:
-                        # Safe to show truncated key ID since user identity matches
-                        short_key_id = (
-                            original_signing_key_id[-4:]
-                            if len(original_signing_key_id) > 4
-                            else original_signing_key_id
-                        )
-                        error_msg = (
-                            "Cannot unlock GPG-signed notebook: "
-                            "You do not have the private key ending in "
-                            f"{short_key_id} required to unlock this notebook. "
-                            "Please ensure you have access to the correct GPG "
-                            "private key."
-                        )
-                    else:
-                        # Don't reveal key information to non-matching users
-                        error_msg = (
-                            "Cannot unlock GPG-signed notebook: You do not "
-                            "have access to the required private key. Only the "
-                            "user with access to the original signing key can "
-                            "unlock this notebook."
-                        )
-
+                    error_msg = _UNLOCK_ERROR_TEMPLATES[
+                        ("cannot_sign", user_matches)
+                    ].format(short_key_id=short_key_id)
                     self.write_error_json(403, error_msg)
                     return
 
-                logger.info(
+                logger.debug(
                     "UnlockNotebookHandler: ✅ Successfully tested signing "
                     "capability with original key"
                 )
 
                 # Step 6: Final verification - ensure commit signature can be verified
-                logger.info(
+                logger.debug(
                     "UnlockNotebookHandler: Performing final signature "
                     "verification..."
                 )
                 (
                     signature_valid_with_current_gpg,
                     verify_error,
-                ) = self.git_service.verify_commit_signature(
+                ) = await git_service.verify_commit_signature(
                     abs_notebook_path, commit_hash
                 )
 
@@ -1143,30 +1115,30 @@ class UnlockNotebookHandler(BaseGitLockSignHandler):
                     )
                     return
 
-                logger.info(
+                logger.debug(
                     "UnlockNotebookHandler: ✅ COMPREHENSIVE GPG KEY "
                     "VALIDATION PASSED"
                 )
-                logger.info(
+                logger.debug(
                     "UnlockNotebookHandler: User has verified access to "
                     "original signing key %s",
                     original_signing_key_id,
                 )
 
             # Update the metadata to reflect the unlocked state
-            logger.info("UnlockNotebookHandler: Updating metadata to unlocked state...")
-            import copy
-
-            updated_metadata = copy.deepcopy(signature_metadata)
+            logger.debug("UnlockNotebookHandler: Updating metadata to unlocked state...")
+            # Only top-level fields are (re)assigned below, so a shallow
+            # copy is sufficient; deepcopy walked the whole mapping.
+            updated_metadata = {**signature_metadata}
             updated_metadata["locked"] = False
             updated_metadata[
                 "unlock_timestamp"
-            ] = self.notebook_service.get_current_timestamp()
+            ] = notebook_service.get_current_timestamp()
             updated_metadata["unlocked_by_user_name"] = unlocking_user.get("name")
             updated_metadata["unlocked_by_user_email"] = unlocking_user.get("email")
 
             # Save the notebook with the updated "unlocked" metadata
-            save_success = self.notebook_service.save_signature_metadata(
+            save_success = notebook_service.save_signature_metadata(
                 abs_notebook_path, notebook_content, updated_metadata
             )
 
@@ -1178,17 +1150,15 @@ class UnlockNotebookHandler(BaseGitLockSignHandler):
                 self.write_error_json(500, "Failed to save updated notebook metadata.")
                 return
 
-            logger.info(
+            logger.debug(
                 "UnlockNotebookHandler: Successfully saved notebook with "
                 "unlocked metadata."
             )
-            logger.info("UnlockNotebookHandler: ===== AUTO-COMMITTING UNLOCK =====")
+            logger.debug("UnlockNotebookHandler: ===== AUTO-COMMITTING UNLOCK =====")
 
             # Automatically commit the unlocked notebook to finalize the state
-            unlock_commit_message = (
-                f"Unlocked notebook: {os.path.basename(notebook_path)}"
-            )
-            logger.info(
+            unlock_commit_message = f"Unlocked notebook: {nb_basename}"
+            logger.debug(
                 "UnlockNotebookHandler: Committing unlocked file with " "message: '%s'",
                 unlock_commit_message,
             )
@@ -1197,7 +1167,7 @@ class UnlockNotebookHandler(BaseGitLockSignHandler):
                 commit_success,
                 unlock_commit_hash,
                 commit_error,
-            ) = self.git_service.commit_and_sign_file(
+            ) = await git_service.commit_and_sign_file(
                 abs_notebook_path, unlock_commit_message
             )
 
@@ -1209,31 +1179,18 @@ class UnlockNotebookHandler(BaseGitLockSignHandler):
                 # Don't fail the whole operation, just warn the user.
                 unlock_message += " (Warning: failed to auto-commit unlock)"
             else:
-                logger.info(
+                logger.debug(
                     "UnlockNotebookHandler: Successfully committed unlock. "
                     "New commit hash: %s",
                     unlock_commit_hash,
                 )
-                # Final update to metadata with the unlock commit hash
+                # The unlock commit hash goes to the frontend only, like
+                # the lock path: storing it in the committed file would
+                # require a second save plus an amend, and it can always
+                # be recovered from git history.
                 updated_metadata["unlock_commit_hash"] = unlock_commit_hash
-                final_save_success = self.notebook_service.save_signature_metadata(
-                    abs_notebook_path, notebook_content, updated_metadata
-                )
-                if final_save_success:
-                    logger.info(
-                        "UnlockNotebookHandler: Amending final commit with "
-                        "unlock_commit_hash..."
-                    )
-                    self.git_service.amend_commit_with_file(
-                        abs_notebook_path, unlock_commit_message
-                    )
-                else:
-                    logger.warning(
-                        "UnlockNotebookHandler: Failed to save final "
-                        "unlock_commit_hash to metadata."
-                    )
 
-            logger.info("UnlockNotebookHandler: ===== UNLOCK SUCCESSFUL =====")
+            logger.debug("UnlockNotebookHandler: ===== UNLOCK SUCCESSFUL =====")
 
             response_data = {
                 "success": True,
@@ -1244,9 +1201,11 @@ class UnlockNotebookHandler(BaseGitLockSignHandler):
                 "metadata": updated_metadata,
             }
 
-            logger.info(
-                "UnlockNotebookHandler: Sending success response: %s",
-                response_data,
+            # Log only the response keys: the metadata value can repr to
+            # kilobytes per request once debug logging is on.
+            logger.debug(
+                "UnlockNotebookHandler: Sending success response with keys: %s",
+                list(response_data),
             )
             logger.info(
                 "UnlockNotebookHandler: SUCCESS - Notebook unlocked and "
@@ -1256,9 +1215,13 @@ class UnlockNotebookHandler(BaseGitLockSignHandler):
 
             self.write_json(response_data)
 
+        except HTTPError:
+            # Intentional HTTP errors (e.g. the 413 from load_json_body)
+            # must reach the client as-is, not as a rewritten 500.
+            raise
         except json.JSONDecodeError as e:
             logger.error("UnlockNotebookHandler: JSON decode error: %s", str(e))
-            self.write_error_json(400, "Invalid JSON in request body")
+            self.write_error_bytes(400, _ERR_INVALID_JSON)
         except Exception as e:
             logger.error(
                 "UnlockNotebookHandler: Unexpected error during unlock: %s",
@@ -1268,8 +1231,6 @@ class UnlockNotebookHandler(BaseGitLockSignHandler):
                 "UnlockNotebookHandler: Error type: %s",
                 type(e).__name__,
             )
-            import traceback
-
             logger.error(
                 "UnlockNotebookHandler: Full traceback:\n%s",
                 traceback.format_exc(),
@@ -1283,7 +1244,7 @@ class UserInfoHandler(BaseGitLockSignHandler):
     async def get(self):
         """Get git user name and email."""
         try:
-            user_info = self.user_service.get_user_info()
+            user_info = await self.user_service.get_user_info()
 
             if user_info:
                 self.write_json({"success": True, "user_info": user_info})
@@ -1306,93 +1267,312 @@ class NotebookStatusHandler(BaseGitLockSignHandler):
     async def post(self):
         """Check if notebook is locked and git commit signature is valid."""
         try:
-            # Get request data
-            data = json.loads(self.request.body.decode("utf-8"))
-            notebook_content = data.get("notebook_content")
-            notebook_path = data.get("notebook_path", "")
-
-            if not notebook_content:
-                self.write_error_json(400, "Missing notebook_content")
-                return
-
-            # Get signature metadata
-            signature_metadata = self.notebook_service.get_signature_metadata(
-                notebook_content
+            # Get request data. Clients only need to send the notebook path;
+            # the notebook is read from disk server-side so status polls do
+            # not ship the full (potentially multi-MB) notebook JSON on every
+            # request. An explicit notebook_content is still honored for
+            # backward compatibility.
+            data = self.load_json_body()
+            status, payload = await self._status_one(
+                data.get("notebook_path", ""),
+                data.get("notebook_content"),
+                raw_body=self.request.body,
             )
+            if status != 200:
+                self.set_status(status)
+            self.write_json(payload)
+
+        except HTTPError:
+            # Intentional HTTP errors (e.g. the 413 from load_json_body)
+            # must reach the client as-is, not as a rewritten 500.
+            raise
+        except json.JSONDecodeError:
+            self.write_error_bytes(400, _ERR_INVALID_JSON)
+        except Exception as e:
+            logger.error("Error checking notebook status: %s", str(e))
+            self.write_error_json(500, f"Internal server error: {str(e)}")
 
-            if not signature_metadata:
-                self.write_json(
+    async def _status_one(
+        self, notebook_path: str, notebook_content=None, raw_body=None
+    ):
+        """Compute the status payload for a single notebook.
+
+        Shared by the single and batch status endpoints. Returns an HTTP
+        status code and the response payload; disk-backed answers are
+        cached under the file's stat signature so repeated polls
+        short-circuit.
+
+        Args:
+            notebook_path: Path to the notebook (may be empty when content
+                is supplied directly)
+            notebook_content: Already-parsed notebook dict, if the client
+                sent one
+            raw_body: Raw request bytes, used for the no-signature byte
+                prefilter when notebook_content came from the request
+        """
+        if not notebook_content and not notebook_path:
+            return 400, {"error": "Missing notebook_path or notebook_content"}
+
+        # Resolve the path once and reuse it for every service call.
+        abs_notebook_path = (
+            self._resolve_path(notebook_path) if notebook_path else ""
+        )
+
+        # When serving from disk, an unchanged (mtime, size) signature
+        # means the previous answer is still valid - return it without
+        # re-parsing, re-hashing or spawning git. Status polls are the
+        # highest-frequency endpoint and usually hit this path. The
+        # keyring mtime is part of the signature so that importing or
+        # revoking a key drops cached signature-validity answers.
+        stat_sig = None
+        if not notebook_content and notebook_path:
+            try:
+                st = os.stat(abs_notebook_path)
+                stat_sig = (
+                    st.st_mtime_ns,
+                    st.st_size,
+                    self.git_service.keyring_mtime(),
+                )
+            except OSError:
+                stat_sig = None
+            if stat_sig is not None:
+                cached = self.status_cache.get(abs_notebook_path)
+                if cached and cached[0] == stat_sig:
+                    return 200, cached[1]
+
+        # A notebook that has never been locked cannot contain the
+        # "git_lock_sign" key anywhere in its JSON. A C-level byte
+        # substring scan answers that common case without parsing
+        # the (potentially multi-MB) document; a false positive from
+        # a code cell merely takes the normal path.
+        if notebook_content:
+            if raw_body is not None and b'"git_lock_sign"' not in raw_body:
+                return 200, self._cache_status(
+                    abs_notebook_path,
+                    stat_sig,
                     {
                         "success": True,
                         "locked": False,
                         "signature_valid": False,
                         "message": "No signature found",
-                    }
+                    },
                 )
-                return
-
-            # Check if locked
-            is_locked = signature_metadata.get("locked", False)
-
-            if not is_locked:
-                self.write_json(
+        else:
+            raw = await asyncio.to_thread(
+                self._read_notebook_bytes, abs_notebook_path
+            )
+            if raw is None:
+                return 400, {
+                    "error": f"Could not read notebook: {notebook_path}"
+                }
+            if b'"git_lock_sign"' not in raw:
+                return 200, self._cache_status(
+                    abs_notebook_path,
+                    stat_sig,
                     {
                         "success": True,
                         "locked": False,
                         "signature_valid": False,
-                        "message": "Notebook is not locked",
-                    }
+                        "message": "No signature found",
+                    },
                 )
-                return
+            try:
+                notebook_content = json_loads(raw)
+            except ValueError:
+                return 400, {
+                    "error": f"Could not read notebook: {notebook_path}"
+                }
+
+        # Get signature metadata
+        signature_metadata = self.notebook_service.get_signature_metadata(
+            notebook_content
+        )
+
+        if not signature_metadata:
+            return 200, self._cache_status(
+                abs_notebook_path,
+                stat_sig,
+                {
+                    "success": True,
+                    "locked": False,
+                    "signature_valid": False,
+                    "message": "No signature found",
+                },
+            )
 
-            # If we have a notebook path, verify git commit signature
-            signature_valid = False
-            message = "Locked but signature verification skipped (no path provided)"
+        # Check if locked
+        is_locked = signature_metadata.get("locked", False)
 
-            if notebook_path:
-                abs_notebook_path = os.path.abspath(notebook_path)
+        if not is_locked:
+            return 200, self._cache_status(
+                abs_notebook_path,
+                stat_sig,
+                {
+                    "success": True,
+                    "locked": False,
+                    "signature_valid": False,
+                    "message": "Notebook is not locked",
+                },
+            )
 
-                if self.git_service.is_git_repository(abs_notebook_path):
-                    commit_hash = signature_metadata.get("commit_hash")
-                    if commit_hash:
+        # If we have a notebook path, verify git commit signature
+        signature_valid = False
+        message = "Locked but signature verification skipped (no path provided)"
+
+        if notebook_path:
+            repo_probe = await self.git_service.probe(abs_notebook_path)
+            if repo_probe["is_repo"]:
+                commit_hash = signature_metadata.get("commit_hash")
+                if not commit_hash:
+                    # The commit hash is not embedded in the file; fall
+                    # back to the last commit touching the notebook.
+                    commit_hash = (
+                        await self.git_service.get_last_commit_for_file(
+                            abs_notebook_path
+                        )
+                    )
+                if commit_hash:
+                    # One cached git invocation covers every notebook
+                    # in the repository; only commits older than the
+                    # map's window need a per-commit check.
+                    verify_error = None
+                    signature_map = await self.git_service.get_signature_map(
+                        repo_probe["toplevel"] or abs_notebook_path
+                    )
+                    if commit_hash in signature_map:
+                        signature_valid = signature_map[commit_hash]
+                        if not signature_valid:
+                            verify_error = (
+                                "Commit signature verification failed"
+                            )
+                    else:
                         (
                             signature_valid,
                             verify_error,
-                        ) = self.git_service.verify_commit_signature(
+                        ) = await self.git_service.verify_commit_signature(
                             abs_notebook_path, commit_hash
                         )
-                        message = (
-                            "Git commit signature verified"
-                            if signature_valid
-                            else f"Git signature verification failed: {verify_error}"
-                        )
-                    else:
-                        message = "No git commit hash found in metadata"
+                    message = (
+                        "Git commit signature verified"
+                        if signature_valid
+                        else f"Git signature verification failed: {verify_error}"
+                    )
                 else:
-                    message = "Not in a git repository"
-
-            # Verify content integrity
-            current_hash = self.notebook_service.generate_content_hash(notebook_content)
+                    message = "No git commit hash found in metadata"
+            else:
+                message = "Not in a git repository"
+
+        # Verify content integrity using the hash scheme the signature
+        # was created with. When signature verification already failed
+        # the answer is negative either way, so skip the hash - it is
+        # the dominant CPU cost of a status check on large notebooks.
+        if signature_valid:
+            current_hash = await asyncio.to_thread(
+                self.notebook_service.generate_content_hash,
+                notebook_content,
+                signature_metadata.get("hash_version", 1),
+            )
             stored_hash = signature_metadata.get("content_hash")
 
             if current_hash != stored_hash:
                 message += " (Content has been modified since signing)"
                 signature_valid = False
 
+        return 200, self._cache_status(
+            abs_notebook_path,
+            stat_sig,
+            {
+                "success": True,
+                "locked": True,
+                "signature_valid": signature_valid,
+                "message": message,
+                "metadata": signature_metadata,
+            },
+        )
+
+    @staticmethod
+    def _read_notebook_bytes(abs_notebook_path: str):
+        """Read the raw notebook bytes, or None when unreadable."""
+        try:
+            with open(abs_notebook_path, "rb") as f:
+                return f.read()
+        except OSError:
+            return None
+
+    def _cache_status(
+        self,
+        abs_notebook_path: str,
+        stat_sig,
+        response: Dict[str, Any],
+    ) -> Dict[str, Any]:
+        """Cache a status response computed from disk state and return it."""
+        if stat_sig is not None:
+            if len(self.status_cache) >= STATUS_CACHE_MAX_ENTRIES:
+                self.status_cache.clear()
+            self.status_cache[abs_notebook_path] = (stat_sig, response)
+        return response
+
+
+class BatchNotebookStatusHandler(NotebookStatusHandler):
+    """Handler for checking the status of several notebooks in one request.
+
+    Workspaces poll the status of every open notebook; answering them in
+    one request amortizes the HTTP round-trips, and the per-item checks
+    share the signature map and verification caches so a poll over N
+    notebooks costs at most one git invocation per repository.
+    """
+
+    # Bound on items processed concurrently; keeps disk reads and
+    # hashing threads from piling up on very large workspaces.
+    MAX_PARALLEL_ITEMS = 4
+
+    async def post(self):
+        """Report lock/signature status for every submitted notebook."""
+        try:
+            data = self.load_json_body()
+            notebooks = data.get("notebooks")
+            if not isinstance(notebooks, list) or not notebooks:
+                self.write_error_json(400, "Missing or empty notebooks list")
+                return
+
+            semaphore = asyncio.Semaphore(self.MAX_PARALLEL_ITEMS)
+
+            async def status_one(item: Any) -> Dict[str, Any]:
+                if not isinstance(item, dict):
+                    return {
+                        "success": False,
+                        "error": "Each notebook entry must be an object",
+                        "notebook_path": None,
+                    }
+                async with semaphore:
+                    status, payload = await self._status_one(
+                        item.get("notebook_path", ""),
+                        item.get("notebook_content"),
+                    )
+                # Copy before annotating: the payload may be a shared
+                # entry in the status cache.
+                result = {**payload}
+                result.setdefault("success", status == 200)
+                result["notebook_path"] = item.get("notebook_path")
+                return result
+
+            results = await asyncio.gather(
+                *(status_one(item) for item in notebooks)
+            )
             self.write_json(
                 {
-                    "success": True,
-                    "locked": True,
-                    "signature_valid": signature_valid,
-                    "message": message,
-                    "metadata": signature_metadata,
+                    "success": all(result["success"] for result in results),
+                    "results": results,
                 }
             )
-
+        except HTTPError:
+            # Intentional HTTP errors (e.g. the 413 from load_json_body)
+            # must reach the client as-is, not as a rewritten 500.
+            raise
         except json.JSONDecodeError:
-            self.write_error_json(400, "Invalid JSON in request body")
+            self.write_error_bytes(400, _ERR_INVALID_JSON)
         except Exception as e:
-            logger.error("Error checking notebook status: %s", str(e))
+            logger.error("Error checking batch notebook status: %s", str(e))
             self.write_error_json(500, f"Internal server error: {str(e)}")
 
 
@@ -1402,237 +1582,16 @@ class CommitNotebookHandler(BaseGitLockSignHandler):
     async def post(self):
         """Stage and commit notebook changes to git."""
         try:
-            logger.info("=== CommitNotebookHandler: Starting commit process ===")
-
-            # Get request data
-            data = json.loads(self.request.body.decode("utf-8"))
-            notebook_path = data.get("notebook_path")
-            notebook_content = data.get("notebook_content")
-            commit_message = data.get("commit_message")
-
-            logger.info(
-                "CommitNotebookHandler: Received request for notebook: %s",
-                notebook_path,
-            )
-            logger.info("CommitNotebookHandler: Commit message: %s", commit_message)
-
-            if not notebook_path or not notebook_content or not commit_message:
-                logger.error("CommitNotebookHandler: Missing required parameters")
-                self.write_error_json(
-                    400,
-                    "Missing notebook_path, notebook_content, or commit_message",
-                )
-                return
-
-            # Convert relative path to absolute path
-            abs_notebook_path = os.path.abspath(notebook_path)
-            logger.info(
-                "CommitNotebookHandler: Absolute path: %s",
-                abs_notebook_path,
-            )
-
-            # Check if file exists
-            if not os.path.exists(abs_notebook_path):
-                logger.error(
-                    "CommitNotebookHandler: File does not exist: %s",
-                    abs_notebook_path,
-                )
-                self.write_error_json(400, f"File does not exist: {abs_notebook_path}")
-                return
-
-            # Check if file is in a git repository
-            logger.info(
-                "CommitNotebookHandler: Checking if file is in git " "repository..."
-            )
-            if not self.git_service.is_git_repository(abs_notebook_path):
-                logger.error(
-                    "CommitNotebookHandler: Not in git repository: %s",
-                    abs_notebook_path,
-                )
-                self.write_error_json(
-                    400,
-                    "Notebook is not in a git repository. Please initialize git "
-                    "repository first.",
-                )
-                return
-            logger.info("CommitNotebookHandler: File is in git repository ✓")
-
-            # Get user info
-            logger.info("CommitNotebookHandler: Getting git user info...")
-            user_info = self.user_service.get_user_info()
-            if not user_info:
-                logger.error("CommitNotebookHandler: No git user configuration found")
-                self.write_error_json(
-                    400,
-                    "Git user configuration not found. Please configure git "
-                    "user.name and user.email",
-                )
-                return
-            logger.info(
-                "CommitNotebookHandler: Git user: %s <%s>",
-                user_info["name"],
-                user_info["email"],
-            )
-
-            # Commit the file with git (notebook already contains metadata
-            # from frontend)
-            logger.info(
-                "CommitNotebookHandler: Calling git_service.commit_and_sign_file()..."
-            )
-            logger.info(
-                "CommitNotebookHandler: Parameters - file: %s, message: %s",
-                abs_notebook_path,
-                commit_message,
-            )
-
-            (
-                commit_success,
-                commit_hash,
-                commit_error,
-            ) = self.git_service.commit_and_sign_file(abs_notebook_path, commit_message)
-
-            logger.info(
-                "CommitNotebookHandler: Git service returned - success: %s, "
-                "hash: %s, error: %s",
-                commit_success,
-                commit_hash,
-                commit_error,
-            )
-
-            if not commit_success:
-                logger.error(
-                    "CommitNotebookHandler: Git commit failed: %s", commit_error
-                )
-                self.write_error_json(500, f"Failed to commit notebook: {commit_error}")
-                return
-
-            # Get commit information
-            logger.info("CommitNotebookHandler: Getting commit information...")
-            if not commit_hash:
-                logger.error("CommitNotebookHandler: No commit hash available")
-                self.write_error_json(500, "No commit hash available")
-                return
-
-            commit_info = self.git_service.get_commit_info(
-                abs_notebook_path, commit_hash
-            )
-            if not commit_info:
-                logger.error("CommitNotebookHandler: Failed to get commit information")
-                self.write_error_json(500, "Failed to get commit information")
-                return
-
-            # Check if commit is actually signed
-            is_signed = commit_info.get("signed", False)
-
-            # Generate content hash for additional verification
-            content_hash = self.notebook_service.generate_content_hash(notebook_content)
-
-            # Create updated metadata with actual commit information
-            updated_metadata = {
-                "commit_hash": commit_hash,
-                "commit_signed": is_signed,
-                "user_name": commit_info.get("author_name", user_info["name"]),
-                "user_email": commit_info.get("author_email", user_info["email"]),
-                "timestamp": commit_info.get(
-                    "timestamp", self.notebook_service.get_current_timestamp()
-                ),
-                "content_hash": content_hash,
-                "commit_message": commit_info.get("message", ""),
-            }
-
-            # If notebook already has git_lock_sign metadata, preserve other fields
-            if (
-                "metadata" in notebook_content
-                and "git_lock_sign" in notebook_content["metadata"]
-            ):
-                existing_metadata = notebook_content["metadata"]["git_lock_sign"].copy()
-                existing_metadata.update(updated_metadata)
-                updated_metadata = existing_metadata
-
-            # Update the notebook file with the actual commit information and
-            # amend the commit
-            logger.info(
-                "CommitNotebookHandler: Updating notebook metadata with actual "
-                "commit info..."
-            )
-            success = self.notebook_service.save_signature_metadata(
-                notebook_path, notebook_content, updated_metadata
-            )
-
-            if not success:
-                logger.warning(
-                    "CommitNotebookHandler: Failed to update metadata in "
-                    "notebook file, but commit succeeded"
-                )
-                # Don't fail the entire operation, just warn
-            else:
-                logger.info(
-                    "CommitNotebookHandler: Successfully updated notebook "
-                    "metadata with commit info"
-                )
-
-                # Amend the commit to include the updated metadata
-                logger.info(
-                    "CommitNotebookHandler: Amending commit to include "
-                    "updated metadata..."
-                )
-                (
-                    amend_success,
-                    new_commit_hash,
-                    amend_error,
-                ) = self.git_service.amend_commit_with_file(
-                    abs_notebook_path, commit_message
-                )
-
-                if amend_success and new_commit_hash:
-                    logger.info(
-                        "CommitNotebookHandler: Successfully amended commit: %s",
-                        new_commit_hash,
-                    )
-                    # Update the commit hash in our response
-                    commit_hash = new_commit_hash
-                    updated_metadata["commit_hash"] = new_commit_hash
-
-                    # Re-check if the amended commit is signed
-                    updated_commit_info = self.git_service.get_commit_info(
-                        abs_notebook_path, new_commit_hash
-                    )
-                    if updated_commit_info:
-                        is_signed = updated_commit_info.get("signed", False)
-                        updated_metadata["commit_signed"] = is_signed
-                        logger.info(
-                            "CommitNotebookHandler: Amended commit signed "
-                            "status: %s",
-                            is_signed,
-                        )
-                else:
-                    logger.warning(
-                        "CommitNotebookHandler: Failed to amend commit: %s",
-                        amend_error,
-                    )
-                    # Continue with original commit, don't fail the operation
-
-            logger.info(
-                "CommitNotebookHandler: SUCCESS - Notebook committed: %s, "
-                "commit: %s, signed: %s",
-                notebook_path,
-                commit_hash,
-                is_signed,
-            )
-            signed = "with GPG signature" if is_signed else "without GPG signature"
-            self.write_json(
-                {
-                    "success": True,
-                    "message": f"Notebook committed successfully {signed}",
-                    "commit_hash": commit_hash,
-                    "signed": is_signed,
-                }
-            )
-
+            data = self.load_json_body()
+            await self._run_commit_flow(data, mark_locked=False)
+        except HTTPError:
+            # Intentional HTTP errors (e.g. the 413 from load_json_body)
+            # must reach the client as-is, not as a rewritten 500.
+            raise
         except json.JSONDecodeError:
-            self.write_error_json(400, "Invalid JSON in request body")
+            self.write_error_bytes(400, _ERR_INVALID_JSON)
         except Exception as e:
-            logger.error("Error committing notebook: %s", {str(e)})
+            logger.error("Error committing notebook: %s", str(e))
             self.write_error_json(500, f"Internal server error: {str(e)}")
 
 
@@ -1643,20 +1602,24 @@ class GitRepositoryStatusHandler(BaseGitLockSignHandler):
         """Get git repository status for a notebook path."""
         try:
             # Get request data
-            data = json.loads(self.request.body.decode("utf-8"))
+            data = self.load_json_body()
             notebook_path = data.get("notebook_path")
 
             if not notebook_path:
-                self.write_error_json(400, "Missing notebook_path")
+                self.write_error_bytes(400, _ERR_MISSING_PATH)
                 return
 
-            abs_notebook_path = os.path.abspath(notebook_path)
-            repo_status = self.git_service.get_repository_status(abs_notebook_path)
+            abs_notebook_path = self._resolve_path(notebook_path)
+            repo_status = await self.git_service.get_repository_status(abs_notebook_path)
 
             self.write_json({"success": True, "repository_status": repo_status})
 
+        except HTTPError:
+            # Intentional HTTP errors (e.g. the 413 from load_json_body)
+            # must reach the client as-is, not as a rewritten 500.
+            raise
         except json.JSONDecodeError:
-            self.write_error_json(400, "Invalid JSON in request body")
+            self.write_error_bytes(400, _ERR_INVALID_JSON)
         except Exception as e:
             logger.error("Error getting repository status: %s", str(e))
             self.write_error_json(500, f"Internal server error: {str(e)}")
@@ -11,6 +11,10 @@ def default_logger_config(logger: logging.Logger) -> None:
     logs to the console with a specific format.
     """
     logger.setLevel(logging.INFO)  # Or logging.DEBUG for more verbose output
+    if logger.handlers:
+        # Already configured (e.g. module reloaded); avoid stacking
+        # duplicate handlers that emit every record twice.
+        return
     handler = logging.StreamHandler(sys.stdout)
     formatter = logging.Formatter(
         "%(asctime)s - %(name)s - %(lineno)d - %(levelname)s - %(message)s"
@@ -1,9 +1,11 @@
 """Service for git operations including commit signing and verification."""
 
+import asyncio
 import logging
 import os
 import subprocess
-from typing import Any, Dict, Optional, Tuple
+import time
+from typing import Any, Dict, List, Optional, Tuple
 
 from git import InvalidGitRepositoryError, Repo
 
@@ -12,6 +14,31 @@ from git_lock_sign_jlx.logger_util import default_logger_config
 logger = logging.getLogger(__name__)
 default_logger_config(logger)
 
+# How long a cached "is this directory inside a git repository?" answer
+# stays valid. Repository membership almost never changes mid-session, so
+# a short TTL keeps status polls from re-spawning git while still picking
+# up newly initialized repositories quickly.
+REPO_CHECK_TTL_SECONDS = 30.0
+
+# How long a cached per-repository signature map stays valid. Status
+# polls for several notebooks in the same repository within this window
+# share one git invocation.
+SIGNATURE_MAP_TTL_SECONDS = 10.0
+
+# How many recent commits the signature map covers. Lock commits are by
+# definition recent; older hashes fall back to a per-commit check.
+SIGNATURE_MAP_COMMITS = 500
+
+# Cap on remembered per-commit signature verification results; the cache
+# is cleared wholesale when it fills, which is plenty for the working set
+# of notebooks a single server sees.
+VERIFY_CACHE_MAX_ENTRIES = 1024
+
+# Upper bound on concurrent signing commits across all repositories.
+# Each signed commit talks to gpg-agent; running too many at once thrashes
+# the agent and can trigger passphrase-prompt pile-ups.
+MAX_CONCURRENT_COMMITS = 4
+
 
 class GitService:
     """Service for managing git operations and commit signing."""
@@ -19,6 +46,61 @@ class GitService:
     def __init__(self):
         """Initialize the git service."""
         self._repo_cache = {}
+        self._repo_check_cache: Dict[str, Tuple[float, bool]] = {}
+        self._probe_cache: Dict[str, Tuple[float, Dict[str, Any]]] = {}
+        self._signature_map_cache: Dict[str, Tuple[float, Dict[str, bool]]] = {}
+        # Per-commit verification results. A commit's signature status is
+        # deterministic for a given keyring state, so entries are keyed by
+        # (commit_hash, keyring mtime) and never expire on their own.
+        self._verify_cache: Dict[Tuple[str, Optional[int]], Tuple[bool, Optional[str]]] = {}
+        # Serialize write operations per repository (git takes index.lock)
+        # and bound signing concurrency globally (gpg-agent thrash).
+        self._repo_locks: Dict[str, asyncio.Lock] = {}
+        self._commit_semaphore = asyncio.Semaphore(MAX_CONCURRENT_COMMITS)
+
+    def _repo_write_lock(self, repo_root: str) -> asyncio.Lock:
+        """Get (or create) the write lock for a repository root."""
+        return self._repo_locks.setdefault(repo_root, asyncio.Lock())
+
+    async def _run_git(
+        self,
+        args: List[str],
+        cwd: Optional[str] = None,
+        timeout: float = 30,
+    ) -> subprocess.CompletedProcess:
+        """
+        Run a git command without blocking the event loop.
+
+        Args:
+            args: Full command argument list (including the "git" executable)
+            cwd: Working directory for the command
+            timeout: Seconds to wait before killing the process
+
+        Returns:
+            CompletedProcess with decoded stdout/stderr
+
+        Raises:
+            subprocess.TimeoutExpired: If the command does not finish in time
+        """
+        proc = await asyncio.create_subprocess_exec(
+            *args,
+            cwd=cwd,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.PIPE,
+        )
+        try:
+            stdout, stderr = await asyncio.wait_for(proc.communicate(), timeout)
+        except asyncio.TimeoutError:
+            proc.kill()
+            await proc.communicate()
+            raise subprocess.TimeoutExpired(args, timeout)
+
+        return subprocess.CompletedProcess(
+            args,
+            proc.returncode if proc.returncode is not None else -1,
+            stdout.decode("utf-8", errors="replace"),
+            stderr.decode("utf-8", errors="replace"),
+        )
 
     def get_repository(self, file_path: str) -> Optional[Repo]:
         """
@@ -55,19 +137,158 @@ class GitService:
             logger.error("Error accessing git repository: %s", str(e))
             return None
 
-    def is_git_repository(self, file_path: str) -> bool:
+    async def is_git_repository(self, file_path: str) -> bool:
         """
         Check if file is within a git repository.
 
+        Results are cached per containing directory with a short TTL so
+        frequent status polls do not repeat the repository discovery.
+
         Args:
             file_path: Path to check
 
         Returns:
             True if within git repository, False otherwise
         """
-        return self.get_repository(file_path) is not None
+        cache_dir = (
+            os.path.dirname(file_path) if os.path.isfile(file_path) else file_path
+        )
+        now = time.monotonic()
+
+        cached = self._repo_check_cache.get(cache_dir)
+        if cached and now - cached[0] < REPO_CHECK_TTL_SECONDS:
+            return cached[1]
+
+        is_repo = self.get_repository(file_path) is not None
+        # Cache positive answers only: a "not a repository" result should
+        # go away on the very next call after the user runs git init, not
+        # after the TTL expires.
+        if is_repo:
+            self._repo_check_cache[cache_dir] = (now, is_repo)
+        return is_repo
+
+    async def probe(self, file_path: str) -> Dict[str, Any]:
+        """
+        Probe repository membership and git user identity in one pass.
+
+        Handlers that need both "is this file in a repository?" and the
+        configured user.name/user.email used to spawn several git
+        processes for state that is stable for the session. This batches
+        the lookups into two concurrent git invocations and caches the
+        combined answer per containing directory with the same TTL as
+        :meth:`is_git_repository`.
+
+        Args:
+            file_path: Path to the file (or directory) to probe
+
+        Returns:
+            Dict with keys ``is_repo``, ``toplevel``, ``common_dir``,
+            ``user_name`` and ``user_email`` (the latter four may be None)
+        """
+        cache_dir = (
+            os.path.dirname(file_path) if os.path.isfile(file_path) else file_path
+        )
+        now = time.monotonic()
+
+        cached = self._probe_cache.get(cache_dir)
+        if cached and now - cached[0] < REPO_CHECK_TTL_SECONDS:
+            return cached[1]
+
+        result: Dict[str, Any] = {
+            "is_repo": False,
+            "toplevel": None,
+            "common_dir": None,
+            "user_name": None,
+            "user_email": None,
+        }
+        try:
+            rev_result, config_result = await asyncio.gather(
+                self._run_git(
+                    [
+                        "git",
+                        "-C",
+                        cache_dir,
+                        "rev-parse",
+                        "--show-toplevel",
+                        "--git-common-dir",
+                    ],
+                    timeout=10,
+                ),
+                self._run_git(
+                    [
+                        "git",
+                        "-C",
+                        cache_dir,
+                        "config",
+                        "--get-regexp",
+                        r"^user\.(name|email)$",
+                    ],
+                    timeout=10,
+                ),
+            )
+
+            if rev_result.returncode == 0:
+                lines = rev_result.stdout.splitlines()
+                result["is_repo"] = True
+                result["toplevel"] = lines[0].strip() if lines else None
+                result["common_dir"] = (
+                    lines[1].strip() if len(lines) > 1 else None
+                )
+
+            # git config reads system, global and (when inside a repository)
+            # local scopes, so this covers the same lookup chain as the
+            # separate user-info calls it replaces.
+            if config_result.returncode == 0:
+                for line in config_result.stdout.splitlines():
+                    key, _, value = line.partition(" ")
+                    if key == "user.name":
+                        result["user_name"] = value.strip()
+                    elif key == "user.email":
+                        result["user_email"] = value.strip()
+
+        except subprocess.TimeoutExpired:
+            logger.error("Git probe timed out for: %s", cache_dir)
+        except FileNotFoundError:
+            logger.error("Git command not found")
+        except Exception as e:
+            logger.error("Error probing git repository: %s", str(e))
+
+        # Cache only fully positive probes. A missing repository or
+        # unconfigured user identity is exactly what the user is about to
+        # fix (git init / git config) before retrying, and a cached
+        # failure would keep answering 400 for the rest of the TTL.
+        if result["is_repo"] and result["user_name"] and result["user_email"]:
+            self._probe_cache[cache_dir] = (now, result)
+            # Keep the plain repository-membership cache coherent with
+            # the probe.
+            self._repo_check_cache[cache_dir] = (now, True)
+        return result
+
+    def invalidate_cache(self, file_path: Optional[str] = None):
+        """
+        Invalidate cached repository lookups.
 
-    def commit_and_sign_file(
+        Called by handlers after state-changing operations (commit, amend,
+        rollback) so subsequent checks see fresh repository state.
+
+        Args:
+            file_path: Invalidate only the entry for this path's directory,
+                or all entries if omitted.
+        """
+        # Signature maps are keyed by repository root rather than directory,
+        # so drop them wholesale - rebuilding one is a single git call.
+        self._signature_map_cache.clear()
+        if file_path is None:
+            self._repo_check_cache.clear()
+            self._probe_cache.clear()
+            return
+        cache_dir = (
+            os.path.dirname(file_path) if os.path.isfile(file_path) else file_path
+        )
+        self._repo_check_cache.pop(cache_dir, None)
+        self._probe_cache.pop(cache_dir, None)
+
+    async def commit_and_sign_file(
         self, file_path: str, commit_message: str
     ) -> Tuple[bool, Optional[str], Optional[str]]:
         """
@@ -80,56 +301,172 @@ class GitService:
         Returns:
             Tuple of (success, commit_hash, error_message)
         """
-        try:
-            logger.info("=== GitService.commit_and_sign_file called ===")
-            logger.info("GitService: file_path = %s", file_path)
-            logger.info("GitService: commit_message = %s", commit_message)
+        success, commit_info, error = await self.commit_sign_and_describe(
+            file_path, commit_message
+        )
+        commit_hash = commit_info["hash"] if commit_info else None
+        return success, commit_hash, error
 
+    async def commit_sign_and_describe(
+        self, file_path: str, commit_message: str
+    ) -> Tuple[bool, Optional[Dict[str, Any]], Optional[str]]:
+        """
+        Add file to git, commit with GPG signature, and describe the commit.
+
+        Combines the commit and the follow-up commit-info read into the
+        smallest number of git invocations so handlers do not need a
+        separate commit-info round-trip after every commit.
+
+        Args:
+            file_path: Path to file to commit
+            commit_message: Commit message
+
+        Returns:
+            Tuple of (success, commit_info, error_message) where commit_info
+            has the same shape as _describe_head().
+        """
+        try:
             repo: Repo | None = self.get_repository(file_path)
             if not repo:
                 logger.error("GitService: File is not in a git repository")
                 return False, None, "File is not in a git repository"
 
-            # Get relative path from repo root
-            repo_root = repo.working_dir
+            repo_root = str(repo.working_dir)
             rel_path = os.path.relpath(file_path, repo_root)
 
-            logger.info("GitService: repo_root = %s", repo_root)
-            logger.info("GitService: rel_path = %s", rel_path)
-
-            # Check if file exists
             if not os.path.exists(file_path):
                 logger.error("GitService: File does not exist: %s", file_path)
                 return False, None, f"File does not exist: {file_path}"
 
-            logger.info("GitService: File exists, proceeding with commit...")
-
-            # Try to commit with GPG signature using subprocess for better control
-            commit_hash, signed = self._commit_with_subprocess(
-                str(repo_root), rel_path, commit_message
-            )
+            # Serialize commits per repository to avoid index.lock races
+            # under concurrent requests, and bound overall signing
+            # concurrency so gpg-agent is not thrashed.
+            async with self._commit_semaphore:
+                async with self._repo_write_lock(repo_root):
+                    commit_info = await self._commit_with_subprocess(
+                        repo_root, rel_path, commit_message
+                    )
 
-            if commit_hash:
+            if commit_info:
                 logger.info(
-                    (
-                        "GitService: Successfully "
-                        "committed file: %s, commit: %s, signed: %s"
-                    ),
+                    "GitService: Committed file: %s, commit: %s, signed: %s",
                     rel_path,
-                    commit_hash,
-                    signed,
+                    commit_info["hash"],
+                    commit_info["signed"],
                 )
-                return True, commit_hash, None
-            else:
-                logger.error("GitService: Failed to create git commit")
-                return False, None, "Failed to create git commit"
+                return True, commit_info, None
+
+            logger.error("GitService: Failed to create git commit")
+            return False, None, "Failed to create git commit"
 
         except Exception as e:
             error_msg = f"Error committing file: {str(e)}"
             logger.error("GitService: %s", error_msg)
             return False, None, error_msg
 
-    def verify_commit_signature(
+    async def get_last_commit_for_file(self, file_path: str) -> Optional[str]:
+        """
+        Get the hash of the most recent commit touching a file.
+
+        Used to recover the lock commit for notebooks whose signature
+        metadata does not embed a commit hash (the hash cannot be known
+        before the commit exists).
+
+        Args:
+            file_path: Path to file in repository
+
+        Returns:
+            Commit hash, or None if the file has no history
+        """
+        try:
+            repo = self.get_repository(file_path)
+            if not repo:
+                return None
+
+            repo_root = str(repo.working_dir)
+            rel_path = os.path.relpath(file_path, repo_root)
+
+            result = await self._run_git(
+                ["git", "log", "-1", "--format=%H", "--", rel_path],
+                cwd=repo_root,
+                timeout=30,
+            )
+
+            if result.returncode == 0 and result.stdout.strip():
+                return result.stdout.strip()
+
+            logger.warning(
+                "GitService: No commit history found for file: %s", rel_path
+            )
+            return None
+
+        except subprocess.TimeoutExpired:
+            logger.error("Git log command timed out")
+            return None
+        except Exception as e:
+            logger.error("Error getting last commit for file: %s", str(e))
+            return None
+
+    async def get_signature_map(self, repo_root: str) -> Dict[str, bool]:
+        """
+        Map recent commit hashes to their GPG signature status.
+
+        One ``git log --format='%H %G?'`` invocation answers signature
+        checks for every notebook in the repository, so concurrent status
+        polls share a single subprocess instead of running
+        ``git verify-commit`` each. Cached briefly per repository root.
+
+        Args:
+            repo_root: Path to the repository working directory
+
+        Returns:
+            Dict mapping commit hash to True when the commit carries a
+            valid signature. Commits older than the covered window are
+            simply absent.
+        """
+        now = time.monotonic()
+        cached = self._signature_map_cache.get(repo_root)
+        if cached and now - cached[0] < SIGNATURE_MAP_TTL_SECONDS:
+            return cached[1]
+
+        signature_map: Dict[str, bool] = {}
+        try:
+            result = await self._run_git(
+                [
+                    "git",
+                    "log",
+                    "--format=%H %G?",
+                    f"-n{SIGNATURE_MAP_COMMITS}",
+                ],
+                cwd=repo_root,
+                timeout=30,
+            )
+            if result.returncode == 0:
+                for line in result.stdout.splitlines():
+                    parts = line.split()
+                    if len(parts) == 2:
+                        signature_map[parts[0]] = parts[1] in ("G", "U", "X", "Y")
+        except subprocess.TimeoutExpired:
+            logger.error("Git log command timed out building signature map")
+        except Exception as e:
+            logger.error("Error building signature map: %s", str(e))
+
+        self._signature_map_cache[repo_root] = (now, signature_map)
+        return signature_map
+
+    @staticmethod
+    def keyring_mtime() -> Optional[int]:
+        """mtime of the GPG public keyring, used to key verification caches."""
+        keyring = os.path.join(
+            os.environ.get("GNUPGHOME", os.path.expanduser("~/.gnupg")),
+            "pubring.kbx",
+        )
+        try:
+            return os.stat(keyring).st_mtime_ns
+        except OSError:
+            return None
+
+    async def verify_commit_signature(
         self, file_path: str, commit_hash: str
     ) -> Tuple[bool, Optional[str]]:
         """
@@ -143,6 +480,11 @@ class GitService:
             Tuple of (is_valid, error_message)
         """
         try:
+            cache_key = (commit_hash, self.keyring_mtime())
+            cached = self._verify_cache.get(cache_key)
+            if cached is not None:
+                return cached
+
             repo = self.get_repository(file_path)
             if not repo:
                 return False, "File is not in a git repository"
@@ -155,14 +497,21 @@ class GitService:
 
             # Use git command to verify signature
             # GitPython doesn't have built-in signature verification
-            result = self._verify_commit_signature_cmd(
+            result = await self._verify_commit_signature_cmd(
                 str(repo.working_dir), commit_hash
             )
 
+            if len(self._verify_cache) >= VERIFY_CACHE_MAX_ENTRIES:
+                self._verify_cache.clear()
             if result:
                 logger.info("Commit signature verified successfully: %s", commit_hash)
+                self._verify_cache[cache_key] = (True, None)
                 return True, None
             else:
+                self._verify_cache[cache_key] = (
+                    False,
+                    "Commit signature verification failed",
+                )
                 return False, "Commit signature verification failed"
 
         except Exception as e:
@@ -170,41 +519,85 @@ class GitService:
             logger.error(error_msg)
             return False, error_msg
 
-    def get_commit_info(
+
+    async def get_commit_full_info(
         self, file_path: str, commit_hash: str
     ) -> Optional[Dict[str, Any]]:
         """
-        Get information about a git commit.
+        Get commit metadata and signature details in one git invocation.
+
+        Fuses the commit metadata, signing-key-id and signature-status
+        lookups that would otherwise each need their own subprocess into
+        a single NUL-separated git log read.
 
         Args:
             file_path: Path to file in repository
             commit_hash: Hash of commit
 
         Returns:
-            Dictionary with commit information, or None if error
+            Dictionary with hash, short_hash, message, author_name,
+            author_email, timestamp, signature_status, signed and
+            signing_key_id, or None if the commit cannot be read
         """
         try:
             repo = self.get_repository(file_path)
             if not repo:
                 return None
 
-            commit = repo.commit(commit_hash)
+            result = await self._run_git(
+                [
+                    "git",
+                    "log",
+                    "-1",
+                    "--format=%H%x00%an%x00%ae%x00%aI%x00%G?%x00%GK%x00%s",
+                    commit_hash,
+                ],
+                cwd=str(repo.working_dir),
+                timeout=30,
+            )
+            if result.returncode != 0 or not result.stdout.strip():
+                logger.error(
+                    "get_commit_full_info: git log failed for %s: %s",
+                    commit_hash,
+                    result.stderr.strip(),
+                )
+                return None
 
+            fields = result.stdout.strip("\n").split("\x00")
+            if len(fields) < 7:
+                logger.error(
+                    "get_commit_full_info: unexpected git log output: %r",
+                    result.stdout,
+                )
+                return None
+
+            (
+                full_hash,
+                author_name,
+                author_email,
+                timestamp,
+                signature_status,
+                signing_key_id,
+                subject,
+            ) = fields[:7]
             return {
-                "hash": commit.hexsha,
-                "short_hash": commit.hexsha[:8],
-                "message": commit.message.strip(),
-                "author_name": commit.author.name,
-                "author_email": commit.author.email,
-                "timestamp": commit.committed_datetime.isoformat(),
-                "signed": self._is_commit_signed(str(repo.working_dir), commit_hash),
+                "hash": full_hash,
+                "short_hash": full_hash[:8],
+                "message": subject.strip(),
+                "author_name": author_name,
+                "author_email": author_email,
+                "timestamp": timestamp,
+                "signature_status": signature_status,
+                # Same status codes the signature map treats as signed.
+                "signed": signature_status in ("G", "U", "X", "Y"),
+                "signing_key_id": signing_key_id or None,
             }
 
         except Exception as e:
-            logger.error("Error getting commit info: %s", str(e))
+            logger.error("Error getting full commit info: %s", str(e))
             return None
 
-    def _is_gpg_signing_configured(
+    async def _is_gpg_signing_configured(
         self, repo_path: str
     ) -> Tuple[bool, Optional[str], str]:
         """
@@ -220,13 +613,10 @@ class GitService:
             logger.info("Checking GPG configuration in repository: %s", repo_path)
 
             # Check for signing key (local first, then global)
-            local_key_result = subprocess.run(
+            local_key_result = await self._run_git(
                 ["git", "config", "user.signingkey"],
                 cwd=repo_path,
-                capture_output=True,
-                text=True,
                 timeout=10,
-                check=False,
             )
 
             if local_key_result.returncode == 0 and local_key_result.stdout.strip():
@@ -235,13 +625,10 @@ class GitService:
                 return True, signing_key, "local"
 
             # Check global signing key
-            global_key_result = subprocess.run(
+            global_key_result = await self._run_git(
                 ["git", "config", "--global", "user.signingkey"],
                 cwd=repo_path,
-                capture_output=True,
-                text=True,
                 timeout=10,
-                check=False,
             )
 
             if global_key_result.returncode == 0 and global_key_result.stdout.strip():
@@ -250,13 +637,10 @@ class GitService:
                 return True, signing_key, "global"
 
             # Check if commit.gpgsign is enabled (local first, then global)
-            local_gpgsign_result = subprocess.run(
+            local_gpgsign_result = await self._run_git(
                 ["git", "config", "commit.gpgsign"],
                 cwd=repo_path,
-                capture_output=True,
-                text=True,
                 timeout=10,
-                check=False,
             )
 
             if local_gpgsign_result.returncode == 0:
@@ -266,13 +650,10 @@ class GitService:
                     return True, None, "local"
 
             # Check global commit.gpgsign
-            global_gpgsign_result = subprocess.run(
+            global_gpgsign_result = await self._run_git(
                 ["git", "config", "--global", "commit.gpgsign"],
                 cwd=repo_path,
-                capture_output=True,
-                text=True,
                 timeout=10,
-                check=False,
             )
 
             if global_gpgsign_result.returncode == 0:
@@ -291,7 +672,7 @@ class GitService:
             logger.error("Error checking GPG configuration: %s", str(e))
             return False, None, "error"
 
-    def _verify_commit_signature_cmd(self, repo_path: str, commit_hash: str) -> bool:
+    async def _verify_commit_signature_cmd(self, repo_path: str, commit_hash: str) -> bool:
         """
         Verify commit signature using git command line.
 
@@ -304,13 +685,10 @@ class GitService:
         """
         try:
             # Use git verify-commit command
-            result = subprocess.run(
+            result = await self._run_git(
                 ["git", "verify-commit", commit_hash],
                 cwd=repo_path,
-                capture_output=True,
-                text=True,
                 timeout=30,
-                check=False,
             )
 
             return result.returncode == 0
@@ -319,73 +697,70 @@ class GitService:
             logger.error("Git verify-commit command timed out")
             return False
         except Exception as e:
-            logger.error(f"Error running git verify-commit: {str(e)}")
+            logger.error("Error running git verify-commit: %s", str(e))
             return False
 
-    def _is_commit_signed(self, repo_path: str, commit_hash: str) -> bool:
+
+    async def _describe_head(self, repo_path: str) -> Optional[Dict[str, Any]]:
         """
-        Check if a commit is signed.
+        Read hash, author, timestamp, signature status, and message of HEAD.
+
+        Uses a single ``git log -1`` invocation instead of separate
+        rev-parse/show/log calls.
 
         Args:
             repo_path: Path to git repository
-            commit_hash: Commit hash to check
 
         Returns:
-            True if commit is signed, False otherwise
+            Dictionary with commit information, or None if error
         """
         try:
-            # Use git show command with signature info
-            result = subprocess.run(
+            result = await self._run_git(
                 [
                     "git",
-                    "show",
-                    "--show-signature",
-                    "--format=%G?",
-                    "-s",
-                    commit_hash,
+                    "log",
+                    "-1",
+                    "--format=%H%n%an%n%ae%n%aI%n%G?%n%s",
+                    "HEAD",
                 ],
                 cwd=repo_path,
-                capture_output=True,
-                text=True,
                 timeout=30,
-                check=False,
-            )
-            logger.info(
-                "_is_commit_signed: git show return code: %s", result.returncode
             )
-            logger.info("_is_commit_signed: git show stdout: %r", result.stdout)
-            logger.info("_is_commit_signed: git show stderr: %r", result.stderr)
 
-            if result.returncode == 0:
-                # %G? format returns signature status, but extra output may be
-                # present. Extract the last non-empty line and check if it's a
-                # valid signature code.
-                lines = [
-                    line.strip() for line in result.stdout.splitlines() if line.strip()
-                ]
-                logger.info("_is_commit_signed: split lines: %r", lines)
-                if lines:
-                    last_line = lines[-1]
-                    logger.info("_is_commit_signed: last_line: %r", last_line)
-                    return last_line in ["G", "U", "X", "Y"]
-                return False
-
-            logger.error(
-                "_is_commit_signed: git show failed with return code %s",
-                result.returncode,
-            )
-            return False
+            if result.returncode != 0:
+                logger.error(
+                    "_describe_head: git log failed with return code %s: %s",
+                    result.returncode,
+                    result.stderr,
+                )
+                return None
+
+            lines = result.stdout.splitlines()
+            if len(lines) < 6:
+                logger.error("_describe_head: unexpected git log output: %r", lines)
+                return None
+
+            commit_hash = lines[0].strip()
+            return {
+                "hash": commit_hash,
+                "short_hash": commit_hash[:8],
+                "message": lines[5].strip(),
+                "author_name": lines[1].strip(),
+                "author_email": lines[2].strip(),
+                "timestamp": lines[3].strip(),
+                "signed": lines[4].strip() in ["G", "U", "X", "Y"],
+            }
 
         except subprocess.TimeoutExpired:
-            logger.error("Git show command timed out")
-            return False
+            logger.error("Git log command timed out")
+            return None
         except Exception as e:
-            logger.error("Error checking commit signature: %s", str(e))
-            return False
+            logger.error("Error describing HEAD commit: %s", str(e))
+            return None
 
-    def _commit_with_subprocess(
+    async def _commit_with_subprocess(
         self, repo_path: str, file_path: str, commit_message: str
-    ) -> Tuple[Optional[str], bool]:
+    ) -> Optional[Dict[str, Any]]:
         """
         Create a git commit using subprocess for better GPG control.
 
@@ -395,7 +770,7 @@ class GitService:
             commit_message: Commit message
 
         Returns:
-            Tuple of (commit_hash, is_signed)
+            Commit info dictionary (see _describe_head), or None on failure
         """
         try:
             # Log detailed information for debugging
@@ -414,13 +789,10 @@ class GitService:
                 repo_path,
             )
 
-            add_result = subprocess.run(
+            add_result = await self._run_git(
                 git_add_cmd,
                 cwd=repo_path,
-                capture_output=True,
-                text=True,
                 timeout=30,
-                check=False,
             )
 
             logger.info("Git add return code: %s", add_result.returncode)
@@ -431,7 +803,7 @@ class GitService:
                 logger.error(
                     "Failed to stage file %s: %s", file_path, add_result.stderr
                 )
-                return None, False
+                return None
 
             logger.info("Successfully staged file: %s", file_path)
 
@@ -440,7 +812,7 @@ class GitService:
                 gpg_configured,
                 signing_key,
                 config_source,
-            ) = self._is_gpg_signing_configured(repo_path)
+            ) = await self._is_gpg_signing_configured(repo_path)
 
             if gpg_configured:
                 logger.info("GPG signing is configured (%s)", config_source)
@@ -455,13 +827,10 @@ class GitService:
                     repo_path,
                 )
 
-                result = subprocess.run(
+                result = await self._run_git(
                     git_commit_cmd,
                     cwd=repo_path,
-                    capture_output=True,
-                    text=True,
                     timeout=60,
-                    check=False,
                 )
 
                 logger.info("Git commit -S return code: %s", result.returncode)
@@ -469,29 +838,19 @@ class GitService:
                 logger.info("Git commit -S stderr: %s", result.stderr)
 
                 if result.returncode == 0:
-                    # Get the commit hash
-                    hash_result = subprocess.run(
-                        ["git", "rev-parse", "HEAD"],
-                        cwd=repo_path,
-                        capture_output=True,
-                        text=True,
-                        timeout=10,
-                        check=False,
-                    )
-
-                    if hash_result.returncode == 0:
-                        commit_hash = hash_result.stdout.strip()
-                        # Check if the commit is actually signed
-                        is_signed = self._is_commit_signed(repo_path, commit_hash)
+                    # Describe the new commit (hash + signature status) in a
+                    # single follow-up invocation.
+                    commit_info = await self._describe_head(repo_path)
+                    if commit_info:
                         logger.info(
                             (
                                 "Commit created with GPG signing attempt: "
                                 "%s, actually signed: %s"
                             ),
-                            commit_hash,
-                            is_signed,
+                            commit_info["hash"],
+                            commit_info["signed"],
                         )
-                        return commit_hash, is_signed
+                        return commit_info
 
                 # If GPG signing failed, log the error and try without signing
                 logger.warning(
@@ -502,7 +861,7 @@ class GitService:
                 logger.info("Attempting commit without signature (disabling GPG)")
             else:
                 logger.info("No GPG configuration found, committing without signature")
-            result = subprocess.run(
+            result = await self._run_git(
                 [
                     "git",
                     "-c",
@@ -512,266 +871,30 @@ class GitService:
                     commit_message,
                 ],
                 cwd=repo_path,
-                capture_output=True,
-                text=True,
                 timeout=60,
-                check=False,
             )
 
             if result.returncode == 0:
-                # Get the commit hash
-                hash_result = subprocess.run(
-                    ["git", "rev-parse", "HEAD"],
-                    cwd=repo_path,
-                    capture_output=True,
-                    text=True,
-                    timeout=10,
-                    check=False,
-                )
-
-                if hash_result.returncode == 0:
-                    commit_hash = hash_result.stdout.strip()
-                    logger.info("Commit created without GPG signing: %s", commit_hash)
-                    return commit_hash, False
+                commit_info = await self._describe_head(repo_path)
+                if commit_info:
+                    logger.info(
+                        "Commit created without GPG signing: %s",
+                        commit_info["hash"],
+                    )
+                    return commit_info
 
             logger.error("Failed to create commit: %s", result.stderr)
-            return None, False
+            return None
 
         except subprocess.TimeoutExpired:
             logger.error("Git commit command timed out")
-            return None, False
-        except Exception as e:
-            logger.error("Error creating commit with subprocess: %s", str(e))
-            return None, False
-
-    def amend_commit_with_file(
-        self, file_path: str, commit_message: str
-    ) -> Tuple[bool, Optional[str], Optional[str]]:
-        """
-        Amend the last commit to include updated file content.
-
-        Args:
-            file_path: Path to file to stage and amend
-            commit_message: Commit message (can be same as original)
-
-        Returns:
-            Tuple of (success, commit_hash, error_message)
-        """
-        try:
-            logger.info("=== GitService.amend_commit_with_file called ===")
-            logger.info("GitService: file_path = %s", file_path)
-            logger.info("GitService: commit_message = %s", commit_message)
-
-            repo = self.get_repository(file_path)
-            if not repo:
-                logger.error("GitService: File is not in a git repository")
-                return False, None, "File is not in a git repository"
-
-            # Get relative path from repo root
-            repo_root = str(repo.working_dir)
-            rel_path = os.path.relpath(file_path, repo_root)
-
-            logger.info("GitService: repo_root = %s", repo_root)
-            logger.info("GitService: rel_path = %s", rel_path)
-
-            # Check if file exists
-            if not os.path.exists(file_path):
-                logger.error("GitService: File does not exist: %s", file_path)
-                return False, None, f"File does not exist: {file_path}"
-
-            # Stage the updated file
-            git_add_cmd = ["git", "add", rel_path]
-            logger.info(
-                "Running command: %s (cwd: %s)",
-                " ".join(git_add_cmd),
-                repo_root,
-            )
-
-            add_result = subprocess.run(
-                git_add_cmd,
-                cwd=repo_root,
-                capture_output=True,
-                text=True,
-                timeout=30,
-                check=False,
-            )
-
-            logger.info("Git add return code: %s", add_result.returncode)
-            if add_result.returncode != 0:
-                logger.error("Failed to stage file %s: %s", rel_path, add_result.stderr)
-                return False, None, f"Failed to stage file: {add_result.stderr}"
-
-            # Check GPG configuration
-            (
-                gpg_configured,
-                signing_key,
-                config_source,
-            ) = self._is_gpg_signing_configured(repo_root)
-
-            # Amend the commit
-            if gpg_configured:
-                logger.info(
-                    "GPG signing is configured (%s), amending with signature",
-                    config_source,
-                )
-                git_amend_cmd = [
-                    "git",
-                    "commit",
-                    "--amend",
-                    "-S",
-                    "-m",
-                    commit_message,
-                ]
-            else:
-                logger.info("No GPG configuration found, amending without signature")
-                git_amend_cmd = [
-                    "git",
-                    "-c",
-                    "commit.gpgsign=false",
-                    "commit",
-                    "--amend",
-                    "-m",
-                    commit_message,
-                ]
-
-            logger.info(
-                "Running command: %s (cwd: %s)",
-                " ".join(git_amend_cmd),
-                repo_root,
-            )
-
-            amend_result = subprocess.run(
-                git_amend_cmd,
-                cwd=repo_root,
-                capture_output=True,
-                text=True,
-                timeout=60,
-                check=False,
-            )
-
-            logger.info("Git commit --amend return code: %s", amend_result.returncode)
-            logger.info("Git commit --amend stdout: %s", amend_result.stdout)
-            logger.info("Git commit --amend stderr: %s", amend_result.stderr)
-
-            if amend_result.returncode == 0:
-                # Get the new commit hash
-                hash_result = subprocess.run(
-                    ["git", "rev-parse", "HEAD"],
-                    cwd=repo_root,
-                    capture_output=True,
-                    text=True,
-                    timeout=10,
-                    check=False,
-                )
-
-                if hash_result.returncode == 0:
-                    commit_hash = hash_result.stdout.strip()
-                    logger.info("Successfully amended commit: %s", commit_hash)
-                    return True, commit_hash, None
-                else:
-                    logger.error("Failed to get amended commit hash")
-                    return False, None, "Failed to get amended commit hash"
-            else:
-                logger.error("Failed to amend commit: %s", amend_result.stderr)
-                return (
-                    False,
-                    None,
-                    f"Failed to amend commit: {amend_result.stderr}",
-                )
-
-        except subprocess.TimeoutExpired:
-            logger.error("Git amend command timed out")
-            return False, None, "Git amend command timed out"
-        except Exception as e:
-            error_msg = f"Error amending commit: {str(e)}"
-            logger.error("GitService: %s", error_msg)
-            return False, None, error_msg
-
-    def get_commit_signing_key_id(
-        self, file_path: str, commit_hash: str
-    ) -> Optional[str]:
-        """
-        Extract the GPG key ID that was used to sign a specific commit.
-
-        Args:
-            file_path: Path to file in repository
-            commit_hash: Hash of commit to check
-
-        Returns:
-            GPG key ID that signed the commit, or None if not signed or error
-        """
-        try:
-            repo = self.get_repository(file_path)
-            if not repo:
-                logger.error("GitService: File is not in a git repository")
-                return None
-
-            repo_path = str(repo.working_dir)
-            logger.info(
-                "GitService: Extracting signing key ID from commit %s",
-                commit_hash,
-            )
-
-            # Use git show command to get signature information
-            result = subprocess.run(
-                [
-                    "git",
-                    "show",
-                    "--show-signature",
-                    "--format=%GK",
-                    "-s",
-                    commit_hash,
-                ],
-                cwd=repo_path,
-                capture_output=True,
-                text=True,
-                timeout=30,
-                check=False,
-            )
-
-            logger.info(
-                "GitService: git show --format=%%GK return code: %s",
-                result.returncode,
-            )
-            logger.info("GitService: git show --format=%%GK stdout: %r", result.stdout)
-            logger.info("GitService: git show --format=%%GK stderr: %r", result.stderr)
-
-            if result.returncode == 0:
-                # %GK format returns the key ID used for signing
-                lines = [
-                    line.strip() for line in result.stdout.splitlines() if line.strip()
-                ]
-                logger.info("GitService: Parsed lines from git show: %r", lines)
-
-                # Look for a line that looks like a key ID (typically 16 hex characters)
-                for line in lines:
-                    # GPG key IDs are typically 8 or 16 hex characters
-                    if len(line) >= 8 and all(
-                        c in "0123456789ABCDEFabcdef" for c in line
-                    ):
-                        logger.info("GitService: Found signing key ID: %s", line)
-                        return line
-
-                logger.warning(
-                    "GitService: No key ID found in git show output for commit %s",
-                    commit_hash,
-                )
-                return None
-            else:
-                logger.error(
-                    "GitService: git show failed with return code %s",
-                    result.returncode,
-                )
-                return None
-
-        except subprocess.TimeoutExpired:
-            logger.error("GitService: git show command timed out")
             return None
         except Exception as e:
-            logger.error("GitService: Error extracting signing key ID: %s", str(e))
+            logger.error("Error creating commit with subprocess: %s", str(e))
             return None
 
-    def rollback_last_commit(self, file_path: str) -> Tuple[bool, Optional[str]]:
+
+    async def rollback_last_commit(self, file_path: str) -> Tuple[bool, Optional[str]]:
         """
         Rollback the last commit in the repository.
 
@@ -790,13 +913,10 @@ class GitService:
             logger.info("GitService: Rolling back last commit in %s", repo_path)
 
             # Use git reset --hard HEAD~1 to rollback the last commit
-            result = subprocess.run(
+            result = await self._run_git(
                 ["git", "reset", "--hard", "HEAD~1"],
                 cwd=repo_path,
-                capture_output=True,
-                text=True,
                 timeout=30,
-                check=False,
             )
 
             logger.info("GitService: git reset return code: %s", result.returncode)
@@ -817,7 +937,7 @@ class GitService:
             logger.error("GitService: Error rolling back commit: %s", str(e))
             return False, f"Error rolling back commit: {str(e)}"
 
-    def get_repository_status(self, file_path: str) -> Dict[str, Any]:
+    async def get_repository_status(self, file_path: str) -> Dict[str, Any]:
         """
         Get comprehensive repository status.
 
@@ -839,7 +959,7 @@ class GitService:
                 gpg_configured,
                 signing_key,
                 config_source,
-            ) = self._is_gpg_signing_configured(str(repo.working_dir))
+            ) = await self._is_gpg_signing_configured(str(repo.working_dir))
 
             return {
                 "is_git_repo": True,
@@ -1,8 +1,10 @@
 """Service for GPG signing and verification operations."""
 
 import logging
+import os
 import tempfile
-from typing import Optional
+import time
+from typing import Any, Dict, Optional, Tuple
 
 import gnupg
 
@@ -11,6 +13,12 @@ from git_lock_sign_jlx.logger_util import default_logger_config
 logger = logging.getLogger(__name__)
 default_logger_config(logger)
 
+# How long a cached signing-precondition answer stays valid. Each uncached
+# check spawns several gpg processes (and a test signature), which can take
+# around a second with a cold gpg-agent; keys and git config rarely change
+# mid-session, and the cache is additionally dropped when they do.
+PRECHECK_TTL_SECONDS = 60.0
+
 
 class GPGService:
     """Service for GPG signing and verification operations."""
@@ -19,6 +27,13 @@ class GPGService:
         """Initialize the GPG service."""
         self.gpg = gnupg.GPG()
         self._default_key = None
+        self._precheck_cache: Optional[
+            Tuple[float, Tuple, Tuple[bool, Optional[str], Optional[str]]]
+        ] = None
+        # Memoized results of the cheap state probes (gpg availability,
+        # signing-key presence, configured key), keyed by probe name with
+        # the same TTL/fingerprint policy as the precheck cache.
+        self._state_cache: Dict[str, Tuple[float, Tuple, Any]] = {}
 
     def sign_content(self, content: str) -> Optional[str]:
         """
@@ -135,6 +150,28 @@ class GPGService:
             logger.error("Error getting default GPG key: %s", str(e))
             return None
 
+    def _memoized(self, key: str, compute) -> Any:
+        """
+        Memoize a state probe with the TTL/fingerprint precheck policy.
+
+        The probes below each fork gpg or git; their answers only change
+        when the keyring or git config does, which the fingerprint
+        detects ahead of the TTL.
+        """
+        now = time.monotonic()
+        fingerprint = self._config_fingerprint()
+        cached = self._state_cache.get(key)
+        if (
+            cached
+            and now - cached[0] < PRECHECK_TTL_SECONDS
+            and fingerprint == cached[1]
+        ):
+            return cached[2]
+
+        value = compute()
+        self._state_cache[key] = (now, fingerprint, value)
+        return value
+
     def is_gpg_available(self) -> bool:
         """
         Check if GPG is available and working.
@@ -142,6 +179,10 @@ class GPGService:
         Returns:
             True if GPG is available, False otherwise
         """
+        return self._memoized("gpg_available", self._is_gpg_available_uncached)
+
+    def _is_gpg_available_uncached(self) -> bool:
+        """Probe GPG availability without caching."""
         try:
             # Try to list keys to test GPG availability
             self.gpg.list_keys()
@@ -157,6 +198,10 @@ class GPGService:
         Returns:
             True if signing key is available, False otherwise
         """
+        return self._memoized("has_signing_key", self._has_signing_key_uncached)
+
+    def _has_signing_key_uncached(self) -> bool:
+        """Probe for a secret signing key without caching."""
         try:
             secret_keys = self.gpg.list_keys(True)
             return len(secret_keys) > 0
@@ -231,6 +276,113 @@ class GPGService:
             )
             return False
 
+    def _config_fingerprint(self) -> Tuple:
+        """
+        Fingerprint the files that determine signing capability.
+
+        Used to invalidate the cached precondition check when the git
+        configuration or the GPG keyring changes on disk.
+        """
+        gnupg_home = self.gpg.gnupghome or os.path.expanduser("~/.gnupg")
+        paths = (
+            os.path.expanduser("~/.gitconfig"),
+            os.path.join(gnupg_home, "pubring.kbx"),
+        )
+        fingerprint = []
+        for path in paths:
+            try:
+                fingerprint.append(os.stat(path).st_mtime_ns)
+            except OSError:
+                fingerprint.append(None)
+        return tuple(fingerprint)
+
+    def validate_signing_preconditions(
+        self,
+    ) -> Tuple[bool, Optional[str], Optional[str]]:
+        """
+        Run all lock-time GPG prechecks, caching the combined answer.
+
+        Aggregates is_gpg_available(), has_signing_key(),
+        get_configured_signing_key() and can_sign_with_key() - three to
+        four process spawns when uncached - into one call whose result is
+        reused for PRECHECK_TTL_SECONDS or until the git config/keyring
+        changes on disk.
+
+        Returns:
+            Tuple of (ok, configured_key, error_message). error_message is
+            a user-facing explanation when ok is False.
+        """
+        now = time.monotonic()
+        fingerprint = self._config_fingerprint()
+        if (
+            self._precheck_cache
+            and now - self._precheck_cache[0] < PRECHECK_TTL_SECONDS
+            and fingerprint == self._precheck_cache[1]
+        ):
+            return self._precheck_cache[2]
+
+        result = self._check_signing_preconditions()
+        self._precheck_cache = (now, fingerprint, result)
+        return result
+
+    def _check_signing_preconditions(
+        self,
+    ) -> Tuple[bool, Optional[str], Optional[str]]:
+        """
+        Run the signing prechecks without caching.
+
+        All independent checks are evaluated before reporting, so a user
+        who is missing several things (say, no signing key and no git
+        configuration) learns about all of them from a single failed
+        request instead of fixing one issue per round-trip. Only the
+        actual signing test is skipped when no key is configured to test.
+        """
+        errors = []
+
+        if not self.is_gpg_available():
+            logger.error("GPGService: GPG not available for signing")
+            errors.append(
+                "Cannot lock notebook: GPG is required for locking but "
+                "not available. Please ensure GPG is installed and "
+                "configured."
+            )
+
+        if not self.has_signing_key():
+            logger.error("GPGService: No GPG signing keys available")
+            errors.append(
+                "Cannot lock notebook: No GPG signing keys available. "
+                "Please ensure you have a GPG key configured for "
+                "signing."
+            )
+
+        configured_key = self.get_configured_signing_key()
+        if not configured_key:
+            logger.error("GPGService: No git signing key configured")
+            errors.append(
+                "Cannot lock notebook: No git signing key configured. "
+                "Please configure a GPG key with: git config "
+                "user.signingkey [YOUR_KEY_ID]"
+            )
+        elif not errors and not self.can_sign_with_key(configured_key):
+            logger.error(
+                "GPGService: Cannot sign with configured key %s", configured_key
+            )
+            errors.append(
+                "Cannot lock notebook: Cannot sign with configured GPG "
+                "key. Please ensure you have access to the private key "
+                "for signing."
+            )
+
+        if errors:
+            return False, configured_key, "\n".join(errors)
+
+        return True, configured_key, None
+
+    def clear_precheck_cache(self):
+        """Clear the cached precondition and probe results to force a re-check."""
+        self._precheck_cache = None
+        self._state_cache.clear()
+
     def get_configured_signing_key(self) -> Optional[str]:
         """
         Get the currently configured git signing key from git config.
@@ -238,6 +390,12 @@ class GPGService:
         Returns:
             The configured signing key ID, or None if not configured
         """
+        return self._memoized(
+            "configured_signing_key", self._get_configured_signing_key_uncached
+        )
+
+    def _get_configured_signing_key_uncached(self) -> Optional[str]:
+        """Read the signing key from git config without caching."""
         try:
             import subprocess
 
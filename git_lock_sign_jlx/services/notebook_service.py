@@ -7,24 +7,45 @@ import os
 from datetime import datetime
 from typing import Any, Dict, Optional
 
+try:
+    import orjson
+except ImportError:
+    # orjson is an optional accelerator; fall back to the stdlib.
+    orjson = None
+
 from git_lock_sign_jlx.logger_util import default_logger_config
 
 logger = logging.getLogger(__name__)
 default_logger_config(logger)
 
+# Canonical encoder for content hashing. iterencode() yields the document
+# in chunks, keeping peak memory flat for notebooks with large outputs.
+_CANONICAL_ENCODER = json.JSONEncoder(sort_keys=True, separators=(",", ":"))
+
 
 class NotebookService:
     """Service for managing notebook metadata and content operations."""
 
+    #: Current content-hash scheme. Version 1 hashed cell source and
+    #: normalized outputs; version 2 hashes only the semantic content
+    #: (cell type, source and non-volatile cell metadata), so re-executing
+    #: a cell no longer invalidates the signature. Stored alongside the
+    #: hash as ``hash_version`` so old signatures keep verifying.
+    HASH_VERSION = 2
+
     def __init__(self):
         """Initialize the notebook service."""
 
-    def generate_content_hash(self, notebook_content: Dict[str, Any]) -> str:
+    def generate_content_hash(
+        self, notebook_content: Dict[str, Any], hash_version: int = HASH_VERSION
+    ) -> str:
         """
         Generate SHA-256 hash of notebook content.
 
         Args:
             notebook_content: Notebook content as dictionary
+            hash_version: Hash scheme to use; pass the ``hash_version``
+                stored in the signature metadata when verifying
 
         Returns:
             SHA-256 hash as hexadecimal string
@@ -32,15 +53,20 @@ class NotebookService:
         try:
             # Create a copy of notebook content without metadata to ensure
             # consistent hashing.
-            content_for_hash = self._prepare_content_for_hashing(notebook_content)
-
-            # Convert to JSON string with consistent formatting
-            content_json = json.dumps(
-                content_for_hash, sort_keys=True, separators=(",", ":")
-            )
-
-            # Generate SHA-256 hash
-            hash_object = hashlib.sha256(content_json.encode("utf-8"))
+            if hash_version >= 2:
+                content_for_hash = self._prepare_content_for_hashing_v2(
+                    notebook_content
+                )
+            else:
+                content_for_hash = self._prepare_content_for_hashing(notebook_content)
+
+            # Stream the canonical JSON encoding straight into the hasher
+            # chunk by chunk instead of materializing the whole document as
+            # one string first. The encoder settings match the previous
+            # json.dumps() call exactly, so existing stored hashes stay valid.
+            hash_object = hashlib.sha256()
+            for chunk in _CANONICAL_ENCODER.iterencode(content_for_hash):
+                hash_object.update(chunk.encode("utf-8"))
             content_hash = hash_object.hexdigest()
 
             logger.debug("Generated content hash: %s", content_hash)
@@ -133,6 +159,65 @@ class NotebookService:
         )
         return essential_content
 
+    def _prepare_content_for_hashing_v2(
+        self, notebook_content: Dict[str, Any]
+    ) -> Any:
+        """Prepare notebook content for version-2 hashing.
+
+        Version 2 hashes only what the user authored: cell type, source and
+        the cell metadata that survives re-execution. Outputs,
+        execution_count, cell ids and transient execution metadata are
+        skipped, so simply re-running a cell does not change the hash.
+
+        Args:
+            notebook_content: Original notebook content as a dictionary.
+
+        Returns:
+            A simplified, clean data structure (list of dicts) for hashing.
+        """
+        if "cells" not in notebook_content or not isinstance(
+            notebook_content["cells"], list
+        ):
+            logger.warning(
+                "NotebookService: 'cells' key not found or not a list. "
+                "Hashing the entire content as a fallback."
+            )
+            return notebook_content
+
+        essential_content = []
+        for i, cell in enumerate(notebook_content["cells"]):
+            if not isinstance(cell, dict):
+                logger.warning(
+                    (
+                        "NotebookService: Item at cell index %s is not a "
+                        "dictionary, skipping."
+                    ),
+                    i,
+                )
+                continue
+
+            cell_metadata = cell.get("metadata", {})
+            if isinstance(cell_metadata, dict):
+                # Drop per-run execution timings; keep everything else
+                # (tags, slide info, ...) since those are user edits.
+                cell_metadata = {
+                    key: value
+                    for key, value in cell_metadata.items()
+                    if key != "execution"
+                }
+            else:
+                cell_metadata = {}
+
+            essential_content.append(
+                {
+                    "cell_type": cell.get("cell_type", ""),
+                    "source": cell.get("source", ""),
+                    "metadata": cell_metadata,
+                }
+            )
+
+        return essential_content
+
     def get_signature_metadata(
         self, notebook_content: Dict[str, Any]
     ) -> Optional[Dict[str, Any]]:
@@ -170,17 +255,14 @@ class NotebookService:
             True if successful, False otherwise
         """
         try:
-            # Create a copy of notebook content
-            import copy
-
-            updated_content = copy.deepcopy(notebook_content)
-
-            # Ensure metadata section exists
-            if "metadata" not in updated_content:
-                updated_content["metadata"] = {}
-
-            # Add signature metadata
-            updated_content["metadata"]["git_lock_sign"] = signature_metadata
+            # Only the metadata mapping is modified, so clone just the two
+            # levels being touched and share the cells (deepcopy walked
+            # every cell and output on each save).
+            updated_content = {**notebook_content}
+            updated_content["metadata"] = {
+                **notebook_content.get("metadata", {}),
+                "git_lock_sign": signature_metadata,
+            }
 
             # Save the updated notebook
             self._save_notebook_file(notebook_path, updated_content)
@@ -211,9 +293,28 @@ class NotebookService:
             # Ensure the directory exists
             os.makedirs(os.path.dirname(abs_path), exist_ok=True)
 
-            # Write notebook content as JSON
-            with open(abs_path, "w", encoding="utf-8") as f:
-                json.dump(notebook_content, f, indent=2, ensure_ascii=False)
+            # Serialize to bytes in one pass (orjson skips the
+            # intermediate str entirely) and write through a temporary
+            # file in the same directory, so a crash mid-write never
+            # leaves a truncated notebook behind.
+            if orjson is not None:
+                encoded = orjson.dumps(notebook_content, option=orjson.OPT_INDENT_2)
+            else:
+                encoded = json.dumps(
+                    notebook_content, indent=2, ensure_ascii=False
+                ).encode("utf-8")
+
+            tmp_path = abs_path + ".tmp"
+            try:
+                with open(tmp_path, "wb") as f:
+                    f.write(encoded)
+                os.replace(tmp_path, abs_path)
+            except BaseException:
+                try:
+                    os.unlink(tmp_path)
+                except OSError:
+                    pass
+                raise
 
             logger.debug("Successfully saved notebook to: %s", abs_path)
 
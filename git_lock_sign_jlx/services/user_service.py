@@ -1,5 +1,6 @@
 """Service for extracting git user information."""
 
+import asyncio
 import logging
 import os
 import subprocess
@@ -20,23 +21,73 @@ class UserService:
     def __init__(self):
         """Initialize the user service."""
         self._cached_user_info = None
+        self._cached_config_mtime: Optional[float] = None
 
-    def get_user_info(self) -> Optional[Dict[str, str]]:
+    def _git_config_mtime(self) -> Optional[float]:
+        """
+        Get the mtime of the active global git config file, if any.
+
+        Used to invalidate the cached user info when the configuration
+        changes on disk.
+        """
+        config_path = os.environ.get("GIT_CONFIG") or os.path.expanduser(
+            "~/.gitconfig"
+        )
+        try:
+            return os.stat(config_path).st_mtime
+        except OSError:
+            return None
+
+    async def _run_git(
+        self, args, timeout: float = 10
+    ) -> subprocess.CompletedProcess:
+        """
+        Run a git command without blocking the event loop.
+
+        Args:
+            args: Full command argument list (including the "git" executable)
+            timeout: Seconds to wait before killing the process
+
+        Returns:
+            CompletedProcess with decoded stdout/stderr
+        """
+        proc = await asyncio.create_subprocess_exec(
+            *args,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.PIPE,
+        )
+        try:
+            stdout, stderr = await asyncio.wait_for(proc.communicate(), timeout)
+        except asyncio.TimeoutError:
+            proc.kill()
+            await proc.communicate()
+            raise subprocess.TimeoutExpired(args, timeout)
+
+        return subprocess.CompletedProcess(
+            args,
+            proc.returncode if proc.returncode is not None else -1,
+            stdout.decode("utf-8", errors="replace"),
+            stderr.decode("utf-8", errors="replace"),
+        )
+
+    async def get_user_info(self) -> Optional[Dict[str, str]]:
         """
         Get git user name and email from git configuration.
 
         Returns:
             Dictionary with 'name' and 'email' keys, or None if not configured.
         """
-        if self._cached_user_info:
+        config_mtime = self._git_config_mtime()
+        if self._cached_user_info and config_mtime == self._cached_config_mtime:
             return self._cached_user_info
 
         try:
             # Try to get user info using direct git commands
-            user_info = self._get_git_config_direct()
+            user_info = await self._get_git_config_direct()
 
             if user_info:
                 self._cached_user_info = user_info
+                self._cached_config_mtime = config_mtime
                 return user_info
 
             logger.warning("Git user configuration not found")
@@ -46,58 +97,31 @@ class UserService:
             logger.error("Error getting git user info: %s", str(e))
             return None
 
-    def _get_git_config_direct(self) -> Optional[Dict[str, str]]:
-        """Get user info using direct git config commands."""
+    async def _get_git_config_direct(self) -> Optional[Dict[str, str]]:
+        """Get user info from git config in a single subprocess call."""
         try:
-            # Use subprocess to call git config directly
-            name_result = subprocess.run(
-                ["git", "config", "user.name"],
-                capture_output=True,
-                text=True,
+            # One --get-regexp call covers system, global and local scope
+            # (the old code forked up to four separate git config calls).
+            # Later scopes are printed last, so the last match wins - the
+            # same precedence git itself applies.
+            result = await self._run_git(
+                ["git", "config", "--get-regexp", r"^user\.(name|email)$"],
                 timeout=10,
-                check=False,
             )
 
-            email_result = subprocess.run(
-                ["git", "config", "user.email"],
-                capture_output=True,
-                text=True,
-                timeout=10,
-                check=False,
-            )
-
-            if name_result.returncode == 0 and email_result.returncode == 0:
-                name = name_result.stdout.strip()
-                email = email_result.stdout.strip()
-
-                if name and email:
-                    logger.info("Found git user config: %s <%s>", name, email)
-                    return {"name": name, "email": email}
-
-            # If direct config fails, try global config explicitly
-            name_result = subprocess.run(
-                ["git", "config", "--global", "user.name"],
-                capture_output=True,
-                text=True,
-                timeout=10,
-                check=False,
-            )
+            name = None
+            email = None
+            if result.returncode == 0:
+                for line in result.stdout.splitlines():
+                    key, _, value = line.partition(" ")
+                    if key == "user.name":
+                        name = value.strip()
+                    elif key == "user.email":
+                        email = value.strip()
 
-            email_result = subprocess.run(
-                ["git", "config", "--global", "user.email"],
-                capture_output=True,
-                text=True,
-                timeout=10,
-                check=False,
-            )
-
-            if name_result.returncode == 0 and email_result.returncode == 0:
-                name = name_result.stdout.strip()
-                email = email_result.stdout.strip()
-
-                if name and email:
-                    logger.info("Found global git user config: %s <%s>", name, email)
-                    return {"name": name, "email": email}
+            if name and email:
+                logger.info("Found git user config: %s <%s>", name, email)
+                return {"name": name, "email": email}
 
             logger.warning("Git user.name and user.email not configured")
             return None
@@ -159,6 +183,7 @@ class UserService:
     def clear_cache(self):
         """Clear cached user info to force refresh."""
         self._cached_user_info = None
+        self._cached_config_mtime = None
 
     def validate_user_info(self, user_info: Dict[str, str]) -> bool:
         """
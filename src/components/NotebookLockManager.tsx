@@ -235,7 +235,10 @@ export class NotebookLockManager implements INotebookLockManager, IDisposable {
 
     try {
       const notebookContent = this._notebookPanel.content.model.toJSON();
-      const response = await gitLockSignAPI.checkNotebookStatus(notebookContent);
+      const response = await gitLockSignAPI.checkNotebookStatus(
+        notebookContent,
+        this._notebookPanel.context.path
+      );
 
       if (response.success) {
         // Update internal state
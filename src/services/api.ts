@@ -116,10 +116,13 @@ export class GitLockSignAPI {
     notebookPath?: string
   ): Promise<INotebookStatusResponse> {
     const url = this._getApiUrl('notebook-status');
-    const request: INotebookStatusRequest = {
-      notebook_content: notebookContent,
-      notebook_path: notebookPath
-    };
+    // Status polls are frequent: when a path is known, send it alone so
+    // the server reads the notebook from disk and can answer from its
+    // cache, instead of shipping the full notebook JSON on every poll.
+    // The content is only included as a fallback for unsaved notebooks.
+    const request: INotebookStatusRequest = notebookPath
+      ? { notebook_path: notebookPath }
+      : { notebook_content: notebookContent };
 
     try {
       const response = await this._makeRequest(url, {
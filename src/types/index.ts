@@ -61,7 +61,12 @@ export interface IUserInfoResponse extends IApiResponse {
 }
 
 export interface INotebookStatusRequest {
-  notebook_content: any;
+  /**
+   * Legacy fallback: when no path is available the full notebook JSON
+   * is sent and the server checks it directly. Path-only requests let
+   * the server read from disk and serve cached answers.
+   */
+  notebook_content?: any;
   notebook_path?: string;
 }
 